@@ -1,6 +1,7 @@
 """Base class for health check detectors."""
 
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 from pathlib import Path
@@ -11,10 +12,15 @@ class Severity(Enum):
     WARNING = "warning"
     INFO = "info"
 
+    @functools.cached_property
+    def label(self) -> str:
+        """Uppercase display label ("CRITICAL", ...), computed once per member."""
+        return self.value.upper()
 
-@dataclass
+
+@dataclass(frozen=True)
 class HealthIssue:
-    """Represents a detected health issue."""
+    """Represents a detected health issue (immutable and hashable)."""
     rule_id: str
     severity: Severity
     title: str
@@ -24,6 +30,11 @@ class HealthIssue:
     fix_template: Optional[str] = None
     fix_prompt: Optional[str] = None  # Full prompt for Claude to fix the issue
     topic_slug: Optional[str] = None  # Links to knowledge base
+    title_key: str = field(init=False, repr=False, compare=False)  # Lowercased title for sorting
+
+    def __post_init__(self):
+        """Lowercase the title once so sorts don't redo it per comparison."""
+        object.__setattr__(self, "title_key", self.title.lower())
 
 
 class BaseDetector:
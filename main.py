@@ -232,6 +232,13 @@ def main(page: ft.Page):
         padding=ft.padding.symmetric(vertical=Spacing.SM),
     )
 
+    def on_keyboard(e: ft.KeyboardEvent):
+        """Global shortcuts: Ctrl/Cmd+Shift+R rescans without the scan cache."""
+        if e.key == "R" and e.shift and (e.ctrl or e.meta) and selected_index == 0:
+            page.run_task(health_scan_page.force_rescan)
+
+    page.on_keyboard_event = on_keyboard
+
     # Initialize
     update_nav_buttons()
     content_area.content = health_scan_page.build()
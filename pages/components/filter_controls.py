@@ -5,6 +5,11 @@ Builds filter and sort dropdowns for issue lists
 
 import flet as ft
 from theme import Colors, Spacing, Typography
+from health_checks.base import Severity
+
+
+# Filter dropdown key for "no severity filter"; other options are keyed by Severity.value
+ALL_SEVERITIES = "All"
 
 
 def build_filter_controls(
@@ -46,12 +51,12 @@ def build_filter_controls(
                             color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
                         ),
                         ft.Dropdown(
-                            value="All",
+                            value=ALL_SEVERITIES,
                             options=[
-                                ft.dropdown.Option("All", f"All ({critical_count + warning_count + info_count})"),
-                                ft.dropdown.Option("CRITICAL", f"Critical ({critical_count})"),
-                                ft.dropdown.Option("WARNING", f"Warning ({warning_count})"),
-                                ft.dropdown.Option("INFO", f"Info ({info_count})"),
+                                ft.dropdown.Option(ALL_SEVERITIES, f"All ({critical_count + warning_count + info_count})"),
+                                ft.dropdown.Option(Severity.CRITICAL.value, f"Critical ({critical_count})"),
+                                ft.dropdown.Option(Severity.WARNING.value, f"Warning ({warning_count})"),
+                                ft.dropdown.Option(Severity.INFO.value, f"Info ({info_count})"),
                             ],
                             on_change=on_filter_change,
                             width=200,
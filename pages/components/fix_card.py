@@ -3,8 +3,24 @@ Fix Card Component
 Displays a single health issue with fix prompt and actions
 """
 
+import functools
+
 import flet as ft
-from theme import Colors, Spacing, Radius, Typography
+from theme import Colors, Spacing, Radius, Typography, with_opacity
+from pages.components.severity_style import (
+    PALETTE,
+    SUGGESTION_BG,
+    SUGGESTION_BORDER,
+    build_severity_separator,
+)
+
+
+# Accent tints shared by every card
+_ACCENT_BG = with_opacity(0.05, Colors.ACCENT_500)
+_ACCENT_BORDER = with_opacity(0.3, Colors.ACCENT_500)
+_ACCENT_BUTTON_BG_DARK = with_opacity(0.15, Colors.ACCENT_500)
+_PROMPT_BG_LIGHT = with_opacity(0.5, Colors.LIGHT_BORDER)
+_PROMPT_BG_DARK = with_opacity(0.5, Colors.PRIMARY_900)
 
 
 def build_fix_card(
@@ -12,7 +28,7 @@ def build_fix_card(
     emoji: str,
     color: str,
     is_dark: bool,
-    selected_issues: dict,
+    selected_issues: set,
     on_issue_selected,
     on_copy_to_clipboard,
     on_learn_more=None,
@@ -26,9 +42,9 @@ def build_fix_card(
         emoji: Severity emoji (🔴/🟡/🔵)
         color: Card accent color
         is_dark: Dark mode flag
-        selected_issues: Dict of selected issue IDs
-        on_issue_selected: Callback for checkbox change (e, issue)
-        on_copy_to_clipboard: Callback for copy button (prompt, title)
+        selected_issues: Set of selected issue IDs
+        on_issue_selected: Callback for checkbox change (e); the issue's rule_id is in e.control.data
+        on_copy_to_clipboard: Callback for copy button (prompt, title, e)
         on_learn_more: Optional callback for Learn More button (issue)
         has_knowledge_topics: Whether this issue has related knowledge topics
 
@@ -37,10 +53,18 @@ def build_fix_card(
     """
     has_fix_prompt = issue.fix_prompt is not None and issue.fix_prompt.strip() != ""
 
+    # Resolve theme-dependent colors once per card
+    palette = PALETTE[is_dark]
+    text_color = palette.text
+    muted_color = palette.muted
+    border_color = palette.border
+    prompt_bg = _PROMPT_BG_DARK if is_dark else _PROMPT_BG_LIGHT
+
     # Create checkbox for this issue
     checkbox = ft.Checkbox(
-        value=selected_issues.get(issue.rule_id, False),
-        on_change=lambda e: on_issue_selected(e, issue),
+        value=issue.rule_id in selected_issues,
+        data=issue.rule_id,
+        on_change=on_issue_selected,
     )
 
     # Build the card content
@@ -55,21 +79,17 @@ def build_fix_card(
                         ft.Row(
                             [
                                 ft.Text(
-                                    issue.severity.value.upper(),
+                                    issue.severity.label,
                                     size=Typography.CAPTION,
                                     weight=ft.FontWeight.BOLD,
                                     color=color,
                                     selectable=True,
                                 ),
-                                ft.Container(
-                                    width=2,
-                                    height=12,
-                                    bgcolor=Colors.LIGHT_BORDER_STRONG if not is_dark else Colors.PRIMARY_500,
-                                ),
+                                build_severity_separator(is_dark),
                                 ft.Text(
                                     issue.rule_id,
                                     size=Typography.CAPTION,
-                                    color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
+                                    color=muted_color,
                                     selectable=True,
                                 ),
                             ],
@@ -79,7 +99,7 @@ def build_fix_card(
                             issue.title,
                             size=Typography.BODY_LG,
                             weight=ft.FontWeight.BOLD,
-                            color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
+                            color=text_color,
                             selectable=True,
                         ),
                     ],
@@ -94,7 +114,7 @@ def build_fix_card(
         ft.Text(
             issue.message,
             size=Typography.BODY_MD,
-            color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
+            color=text_color,
             selectable=True,
         ),
     ]
@@ -113,13 +133,13 @@ def build_fix_card(
                                     "🔧 Fix Prompt",
                                     size=Typography.BODY_SM,
                                     weight=ft.FontWeight.BOLD,
-                                    color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
+                                    color=text_color,
                                 ),
                                 ft.Container(expand=True),
                                 ft.ElevatedButton(
                                     "Copy Prompt",
                                     icon=ft.Icons.CONTENT_COPY_ROUNDED,
-                                    on_click=lambda e, prompt=issue.fix_prompt, title=issue.title: on_copy_to_clipboard(prompt, title),
+                                    on_click=functools.partial(on_copy_to_clipboard, issue.fix_prompt, issue.title),
                                     height=32,
                                 ),
                             ],
@@ -130,22 +150,22 @@ def build_fix_card(
                             content=ft.Text(
                                 issue.fix_prompt,
                                 size=Typography.BODY_SM,
-                                color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
+                                color=muted_color,
                                 selectable=True,
                                 max_lines=5,
                                 overflow=ft.TextOverflow.ELLIPSIS,
                             ),
                             padding=Spacing.SM,
-                            bgcolor=ft.Colors.with_opacity(0.5, Colors.PRIMARY_900 if is_dark else Colors.LIGHT_BORDER),
+                            bgcolor=prompt_bg,
                             border_radius=Radius.SM,
                         ),
                     ],
                     spacing=Spacing.XS,
                 ),
                 padding=Spacing.MD,
-                bgcolor=ft.Colors.with_opacity(0.05, Colors.ACCENT_500),
+                bgcolor=_ACCENT_BG,
                 border_radius=Radius.MD,
-                border=ft.border.all(1, ft.Colors.with_opacity(0.3, Colors.ACCENT_500)),
+                border=ft.border.all(1, _ACCENT_BORDER),
             ),
         ])
     else:
@@ -156,13 +176,13 @@ def build_fix_card(
                 content=ft.Text(
                     "💡 " + issue.suggestion,
                     size=Typography.BODY_SM,
-                    color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
+                    color=muted_color,
                     selectable=True,
                 ),
                 padding=Spacing.MD,
-                bgcolor=ft.Colors.with_opacity(0.03, color),
+                bgcolor=SUGGESTION_BG[issue.severity],
                 border_radius=Radius.MD,
-                border=ft.border.all(1, ft.Colors.with_opacity(0.2, color)),
+                border=ft.border.all(1, SUGGESTION_BORDER[issue.severity]),
             ),
         ])
 
@@ -177,7 +197,7 @@ def build_fix_card(
                     on_click=lambda e: on_learn_more(issue),
                     style=ft.ButtonStyle(
                         color=ft.Colors.WHITE if not is_dark else Colors.ACCENT_500,
-                        bgcolor=Colors.ACCENT_500 if not is_dark else ft.Colors.with_opacity(0.15, Colors.ACCENT_500),
+                        bgcolor=Colors.ACCENT_500 if not is_dark else _ACCENT_BUTTON_BG_DARK,
                     ),
                 ),
                 alignment=ft.alignment.center_right,
@@ -190,7 +210,7 @@ def build_fix_card(
             spacing=Spacing.XS,
         ),
         padding=Spacing.MD,
-        border=ft.border.all(2, Colors.LIGHT_BORDER_STRONG if not is_dark else Colors.PRIMARY_500),
+        border=ft.border.all(2, border_color),
         border_radius=Radius.MD,
-        bgcolor=ft.Colors.with_opacity(0.02, color) if not is_dark else ft.Colors.with_opacity(0.05, color),
+        bgcolor=palette.card_bg[issue.severity],
     )
@@ -4,134 +4,138 @@ Displays a single health issue in scan results
 """
 
 import flet as ft
-from theme import Colors, Spacing, Radius, Typography
+from theme import Spacing, Radius, Typography
+from pages.components.severity_style import PALETTE, SEVERITY_STYLE, SUGGESTION_BG, SUGGESTION_BORDER
 
+# is_dark -> card border, shared by every card
+_CARD_BORDER = {is_dark: ft.border.all(2, palette.border) for is_dark, palette in PALETTE.items()}
+# Severity -> suggestion box border, shared by every card
+_SUGGESTION_BOX_BORDER = {sev: ft.border.all(1, color) for sev, color in SUGGESTION_BORDER.items()}
 
-def build_issue_card(issue, emoji: str, color: str, is_dark: bool) -> ft.Container:
-    """
-    Build a card displaying a health issue.
 
-    Args:
-        issue: HealthIssue object
-        emoji: Severity emoji (🔴/🟡/🔵)
-        color: Card accent color
-        is_dark: Dark mode flag
+class IssueCard:
+    """
+    Issue card whose controls are mutated in place for each issue shown.
 
-    Returns:
-        Container with the issue card UI
+    The card layout is the same for every issue, so the scan page keeps a
+    pool of these and calls update() on rescans instead of rebuilding
+    every card's subtree.
     """
-    return ft.Container(
-        content=ft.Column(
-            [
-                # Header
-                ft.Row(
-                    [
-                        ft.Text(
-                            emoji,
-                            size=24,
-                        ),
-                        ft.Column(
-                            [
-                                ft.Row(
-                                    [
-                                        ft.Text(
-                                            issue.severity.value.upper(),
-                                            size=Typography.CAPTION,
-                                            weight=ft.FontWeight.BOLD,
-                                            color=color,
-                                            selectable=True,
-                                        ),
-                                        ft.Container(
-                                            width=2,
-                                            height=12,
-                                            bgcolor=Colors.LIGHT_BORDER_STRONG if not is_dark else Colors.PRIMARY_500,
-                                        ),
-                                        ft.Text(
-                                            issue.rule_id,
-                                            size=Typography.CAPTION,
-                                            color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                                            selectable=True,
-                                        ),
-                                    ],
-                                    spacing=Spacing.SM,
-                                ),
-                                ft.Text(
-                                    issue.title,
-                                    size=Typography.BODY_LG,
-                                    weight=ft.FontWeight.BOLD,
-                                    color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
-                                    selectable=True,
-                                ),
-                            ],
-                            spacing=Spacing.XS,
-                            expand=True,
-                        ),
-                    ],
-                    spacing=Spacing.MD,
-                ),
-                ft.Container(height=Spacing.SM),
-                # Message
-                ft.Text(
-                    issue.message,
-                    size=Typography.BODY_MD,
-                    color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
-                    selectable=True,
-                ),
-                ft.Container(height=Spacing.SM),
-                # Suggestion
-                ft.Container(
-                    content=ft.Column(
+
+    def __init__(self):
+        self.emoji_text = ft.Text(size=24)
+        self.severity_text = ft.Text(
+            size=Typography.CAPTION,
+            weight=ft.FontWeight.BOLD,
+            selectable=True,
+        )
+        self.separator = ft.Container(width=2, height=12)
+        self.rule_id_text = ft.Text(size=Typography.CAPTION, selectable=True)
+        self.title_text = ft.Text(
+            size=Typography.BODY_LG,
+            weight=ft.FontWeight.BOLD,
+            selectable=True,
+        )
+        self.message_text = ft.Text(size=Typography.BODY_MD, selectable=True)
+        self.suggestion_label = ft.Text(
+            "💡 Suggestion",
+            size=Typography.BODY_SM,
+            weight=ft.FontWeight.BOLD,
+            selectable=True,
+        )
+        self.suggestion_text = ft.Text(size=Typography.BODY_SM, selectable=True)
+        self.suggestion_box = ft.Container(
+            content=ft.Column(
+                [self.suggestion_label, self.suggestion_text],
+                spacing=Spacing.XS,
+            ),
+            padding=Spacing.MD,
+            border_radius=Radius.MD,
+        )
+        self.file_icon = ft.Icon(ft.Icons.DESCRIPTION_OUTLINED, size=16)
+        self.file_text = ft.Text(size=Typography.TINY, selectable=True)
+        # File path if available; hidden rather than removed so the layout is fixed
+        self.file_row = ft.Row([self.file_icon, self.file_text], spacing=Spacing.XS)
+
+        self.container = ft.Container(
+            content=ft.Column(
+                [
+                    # Header
+                    ft.Row(
                         [
-                            ft.Text(
-                                "💡 Suggestion",
-                                size=Typography.BODY_SM,
-                                weight=ft.FontWeight.BOLD,
-                                color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
-                                selectable=True,
-                            ),
-                            ft.Text(
-                                issue.suggestion,
-                                size=Typography.BODY_SM,
-                                color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                                selectable=True,
+                            self.emoji_text,
+                            ft.Column(
+                                [
+                                    ft.Row(
+                                        [self.severity_text, self.separator, self.rule_id_text],
+                                        spacing=Spacing.SM,
+                                    ),
+                                    self.title_text,
+                                ],
+                                spacing=Spacing.XS,
+                                expand=True,
                             ),
                         ],
-                        spacing=Spacing.XS,
+                        spacing=Spacing.MD,
                     ),
-                    padding=Spacing.MD,
-                    bgcolor=ft.Colors.with_opacity(0.03, color),
-                    border_radius=Radius.MD,
-                    border=ft.border.all(1, ft.Colors.with_opacity(0.2, color)),
-                ),
-                # File path if available
-                *(
-                    [
-                        ft.Container(height=Spacing.XS),
-                        ft.Row(
-                            [
-                                ft.Icon(
-                                    ft.Icons.DESCRIPTION_OUTLINED,
-                                    size=16,
-                                    color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                                ),
-                                ft.Text(
-                                    str(issue.file_path),
-                                    size=Typography.TINY,
-                                    color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                                    selectable=True,
-                                ),
-                            ],
-                            spacing=Spacing.XS,
-                        ),
-                    ]
-                    if issue.file_path
-                    else []
-                ),
-            ],
-            spacing=Spacing.XS,
-        ),
-        padding=Spacing.MD,
-        border=ft.border.all(2, Colors.LIGHT_BORDER_STRONG if not is_dark else Colors.PRIMARY_500),
-        border_radius=Radius.MD,
-        bgcolor=ft.Colors.with_opacity(0.02, color) if not is_dark else ft.Colors.with_opacity(0.05, color),
-    )
+                    # Message
+                    self.message_text,
+                    # Suggestion
+                    self.suggestion_box,
+                    self.file_row,
+                ],
+                # Gaps come from the column, not spacer controls, to keep the tree small
+                spacing=Spacing.MD,
+            ),
+            padding=Spacing.MD,
+            border_radius=Radius.MD,
+        )
+        self._shown = (None, None)  # (issue, is_dark) currently displayed
+
+    def update(self, issue, is_dark: bool) -> ft.Container:
+        """
+        Point the card at an issue and theme.
+
+        Args:
+            issue: HealthIssue object (its severity picks the emoji and accent color)
+            is_dark: Dark mode flag
+
+        Returns:
+            The card's Container
+        """
+        # Issues are frozen, so re-rendering an equal one (say, the same issue
+        # decoded from the scan cache) in the same theme is a no-op
+        if self._shown == (issue, is_dark):
+            return self.container
+        self._shown = (issue, is_dark)
+
+        palette = PALETTE[is_dark]
+        text_color = palette.text
+        muted_color = palette.muted
+
+        emoji, color = SEVERITY_STYLE[issue.severity]
+        self.emoji_text.value = emoji
+        self.severity_text.value = issue.severity.label
+        self.severity_text.color = color
+        self.separator.bgcolor = palette.border
+        self.rule_id_text.value = issue.rule_id
+        self.rule_id_text.color = muted_color
+        self.title_text.value = issue.title
+        self.title_text.color = text_color
+        self.message_text.value = issue.message
+        self.message_text.color = text_color
+        self.suggestion_label.color = text_color
+        self.suggestion_text.value = issue.suggestion
+        self.suggestion_text.color = muted_color
+        self.suggestion_box.bgcolor = SUGGESTION_BG[issue.severity]
+        self.suggestion_box.border = _SUGGESTION_BOX_BORDER[issue.severity]
+
+        has_file = bool(issue.file_path)
+        self.file_row.visible = has_file
+        self.file_icon.color = muted_color
+        self.file_text.value = str(issue.file_path) if has_file else None
+        self.file_text.color = muted_color
+
+        self.container.border = _CARD_BORDER[is_dark]
+        self.container.bgcolor = palette.card_bg[issue.severity]
+        return self.container
@@ -4,9 +4,17 @@ Builds UI for health scan results and error states
 """
 
 import flet as ft
-from theme import Colors, Spacing, Radius, Typography
-from health_checks.base import Severity
-from services.health_checker import get_health_checker
+from theme import Colors, Spacing, Radius, Typography, success_icon, with_opacity
+from pages.components.severity_style import PALETTE
+
+
+# Map score color names (HealthReport.score_color) to actual colors
+_COLOR_MAP = {
+    "green": Colors.GREEN_500,
+    "yellow": Colors.YELLOW_500,
+    "orange": Colors.ORANGE_500,
+    "red": Colors.RED_500,
+}
 
 
 def build_not_claude_project(is_dark: bool) -> ft.Container:
@@ -19,142 +27,115 @@ def build_not_claude_project(is_dark: bool) -> ft.Container:
     Returns:
         Container with error message and icon
     """
+    palette = PALETTE[is_dark]
+    text_color = palette.text
+    muted_color = palette.muted
+
     return ft.Container(
-        content=ft.SelectionArea(
-            content=ft.Column(
-                [
-                    ft.Icon(
-                        ft.Icons.FOLDER_OFF_ROUNDED,
-                        size=64,
-                        color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                    ),
-                    ft.Text(
-                        "Not a Claude Code Project",
-                        size=Typography.H2,
-                        weight=ft.FontWeight.BOLD,
-                        color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
-                    ),
-                    ft.Text(
-                        "This directory doesn't appear to be a Claude Code project.\n"
-                        "Claude Code projects should have a .claude/ directory or CLAUDE.md file.",
-                        size=Typography.BODY_MD,
-                        color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                        text_align=ft.TextAlign.CENTER,
-                    ),
-                ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                spacing=Spacing.MD,
-            ),
+        content=ft.Column(
+            [
+                ft.Icon(
+                    ft.Icons.FOLDER_OFF_ROUNDED,
+                    size=64,
+                    color=muted_color,
+                ),
+                ft.Text(
+                    "Not a Claude Code Project",
+                    size=Typography.H2,
+                    weight=ft.FontWeight.BOLD,
+                    color=text_color,
+                    selectable=True,
+                ),
+                ft.Text(
+                    "This directory doesn't appear to be a Claude Code project.\n"
+                    "Claude Code projects should have a .claude/ directory or CLAUDE.md file.",
+                    size=Typography.BODY_MD,
+                    color=muted_color,
+                    text_align=ft.TextAlign.CENTER,
+                    selectable=True,
+                ),
+            ],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=Spacing.MD,
         ),
         padding=Spacing.XL,
         alignment=ft.alignment.center,
     )
 
 
-def build_scan_results(
-    health_report,
-    is_dark: bool,
-    build_issue_card_fn,
-    on_save_report,
-) -> ft.Container:
+def build_no_issues_panel(is_dark: bool) -> ft.Container:
     """
-    Build health scan results display with score, issues, and actions.
+    Build the "No Issues Found!" panel.
 
     Args:
-        health_report: HealthReport object from health_checker
         is_dark: Dark mode flag
-        build_issue_card_fn: Function to build issue card (issue, emoji, color, is_dark) -> Control
-        on_save_report: Callback for save report button click
 
     Returns:
-        Container with complete results UI
+        Container with success icon and message
     """
-    if not health_report:
-        return None
+    palette = PALETTE[is_dark]
+    text_color = palette.text
+    muted_color = palette.muted
 
-    checker = get_health_checker()
-
-    # Score indicator color
-    score_color = checker.get_score_color(health_report.score)
-    score_label = checker.get_score_label(health_report.score)
-
-    # Map color names to actual colors
-    color_map = {
-        "green": Colors.GREEN_500,
-        "yellow": Colors.YELLOW_500,
-        "orange": Colors.ORANGE_500,
-        "red": Colors.RED_500,
-    }
-    indicator_color = color_map.get(score_color, Colors.ACCENT_500)
-
-    # Build issue cards
-    issue_cards = []
-
-    # Group issues by severity
-    critical_issues = [i for i in health_report.issues if i.severity == Severity.CRITICAL]
-    warning_issues = [i for i in health_report.issues if i.severity == Severity.WARNING]
-    info_issues = [i for i in health_report.issues if i.severity == Severity.INFO]
-
-    for issues, severity, emoji, color in [
-        (critical_issues, "CRITICAL", "🔴", Colors.RED_500),
-        (warning_issues, "WARNING", "🟡", Colors.YELLOW_500),
-        (info_issues, "INFO", "🔵", Colors.BLUE_500),
-    ]:
-        for issue in issues:
-            issue_card = build_issue_card_fn(issue, emoji, color, is_dark)
-            issue_cards.append(issue_card)
+    return ft.Container(
+        content=ft.Column(
+            [
+                success_icon(),
+                ft.Text(
+                    "No Issues Found!",
+                    size=Typography.H2,
+                    weight=ft.FontWeight.BOLD,
+                    color=text_color,
+                    selectable=True,
+                ),
+                ft.Text(
+                    "Your Claude Code project looks healthy.",
+                    size=Typography.BODY_MD,
+                    color=muted_color,
+                    selectable=True,
+                ),
+            ],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=Spacing.MD,
+        ),
+        padding=Spacing.XL,
+        alignment=ft.alignment.center,
+    )
 
-    # Build the controls list
-    controls = [
-        # Score header
-        ft.Container(
+
+class ScoreHeader:
+    """
+    Health score header whose texts are mutated in place between scans.
+
+    The layout never changes between scans, only the score, label, issue
+    count, and colors, so the owning page keeps one instance and calls
+    update() instead of rebuilding the subtree.
+    """
+
+    def __init__(self):
+        self.score_text = ft.Text(size=48, weight=ft.FontWeight.BOLD, selectable=True)
+        self.out_of_text = ft.Text("/ 100", size=Typography.BODY_MD, selectable=True)
+        self.caption_text = ft.Text(
+            "Health Score",
+            size=Typography.CAPTION,
+            weight=ft.FontWeight.BOLD,
+            selectable=True,
+        )
+        self.label_text = ft.Text(size=Typography.H2, weight=ft.FontWeight.BOLD, selectable=True)
+        self.count_text = ft.Text(size=Typography.BODY_SM, selectable=True)
+        self.container = ft.Container(
             content=ft.Row(
                 [
                     ft.Container(
                         content=ft.Column(
-                            [
-                                ft.Text(
-                                    str(health_report.score),
-                                    size=48,
-                                    weight=ft.FontWeight.BOLD,
-                                    color=indicator_color,
-                                    selectable=True,
-                                ),
-                                ft.Text(
-                                    "/ 100",
-                                    size=Typography.BODY_MD,
-                                    color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                                    selectable=True,
-                                ),
-                            ],
+                            [self.score_text, self.out_of_text],
                             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                             spacing=0,
                         ),
                     ),
                     ft.Container(width=Spacing.XL),
                     ft.Column(
-                        [
-                            ft.Text(
-                                "Health Score",
-                                size=Typography.CAPTION,
-                                weight=ft.FontWeight.BOLD,
-                                color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                                selectable=True,
-                            ),
-                            ft.Text(
-                                score_label,
-                                size=Typography.H2,
-                                weight=ft.FontWeight.BOLD,
-                                color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
-                                selectable=True,
-                            ),
-                            ft.Text(
-                                f"{len(health_report.issues)} issues found",
-                                size=Typography.BODY_SM,
-                                color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                                selectable=True,
-                            ),
-                        ],
+                        [self.caption_text, self.label_text, self.count_text],
                         spacing=Spacing.XS,
                         expand=True,
                     ),
@@ -162,12 +143,95 @@ def build_scan_results(
                 spacing=Spacing.MD,
             ),
             padding=Spacing.XL,
-            bgcolor=ft.Colors.with_opacity(0.05, indicator_color),
-            border=ft.border.all(2, indicator_color),
             border_radius=Radius.LG,
-        ),
-        ft.Container(height=Spacing.SM),
-        # Save report button
+        )
+        self._shown_key = None  # (score, issue count, is_dark) currently displayed
+
+    def update(self, health_report, is_dark: bool):
+        """
+        Point the header at a new report and theme.
+
+        Args:
+            health_report: HealthReport object from health_checker
+            is_dark: Dark mode flag
+        """
+        # Rescans of an unchanged project show the same header
+        key = (health_report.score, len(health_report.issues), is_dark)
+        if key == self._shown_key:
+            return
+        self._shown_key = key
+
+        # Score indicator color
+        indicator_color = _COLOR_MAP.get(health_report.score_color, Colors.ACCENT_500)
+
+        palette = PALETTE[is_dark]
+        text_color = palette.text
+        muted_color = palette.muted
+
+        self.score_text.value = str(health_report.score)
+        self.score_text.color = indicator_color
+        self.out_of_text.color = muted_color
+        self.caption_text.color = muted_color
+        self.label_text.value = health_report.score_label
+        self.label_text.color = text_color
+        self.count_text.value = f"{len(health_report.issues)} issues found"
+        self.count_text.color = muted_color
+        self.container.bgcolor = with_opacity(0.05, indicator_color)
+        self.container.border = ft.border.all(2, indicator_color)
+
+
+def build_scan_results(
+    health_report,
+    is_dark: bool,
+    build_issue_card_fn,
+    on_save_report,
+    score_header: "ScoreHeader" = None,
+    results_column: ft.Column = None,
+    build_no_issues_panel_fn=build_no_issues_panel,
+) -> ft.Container:
+    """
+    Build health scan results display with score, issues, and actions.
+
+    A report with no issues gets a minimal tree: the score header and the
+    "No Issues Found!" panel, without the Save Report action.
+
+    Args:
+        health_report: HealthReport object from health_checker
+        is_dark: Dark mode flag
+        build_issue_card_fn: Function to build issue card (issue, is_dark) -> Control
+        on_save_report: Callback for save report button click
+        score_header: Optional ScoreHeader to reuse across scans
+        results_column: Optional Column to reuse across scans
+        build_no_issues_panel_fn: Function to build the all-clear panel
+            (is_dark) -> Control; lets the caller reuse one per theme
+
+    Returns:
+        Container with complete results UI
+    """
+    if not health_report:
+        return None
+
+    header = score_header or ScoreHeader()
+    header.update(health_report, is_dark)
+
+    if not health_report.issues:
+        # Healthy project: just the score and the all-clear, nothing to save
+        return ft.Container(
+            content=ft.Column(
+                [
+                    header.container,
+                    build_no_issues_panel_fn(is_dark),
+                ],
+                spacing=Spacing.XL,
+            ),
+            padding=Spacing.MD,
+        )
+
+    # Build issue cards from the report's severity buckets (CRITICAL first)
+    controls = [
+        # Score header
+        header.container,
+        # Save report button; its margin stands in for spacer controls
         ft.Container(
             content=ft.ElevatedButton(
                 "Save Report",
@@ -175,54 +239,20 @@ def build_scan_results(
                 on_click=on_save_report,
             ),
             alignment=ft.alignment.center_right,
+            margin=ft.margin.symmetric(vertical=Spacing.LG),
         ),
-        ft.Container(height=Spacing.MD),
     ]
+    for issues in health_report.by_severity.values():
+        for issue in issues:
+            controls.append(build_issue_card_fn(issue, is_dark))
 
-    # Add issues or "no issues" message
-    if issue_cards:
-        controls.extend(issue_cards)
-    else:
-        controls.append(
-            ft.Container(
-                content=ft.Column(
-                    [
-                        ft.Icon(
-                            ft.Icons.CHECK_CIRCLE_ROUNDED,
-                            size=64,
-                            color=Colors.GREEN_500,
-                        ),
-                        ft.Text(
-                            "No Issues Found!",
-                            size=Typography.H2,
-                            weight=ft.FontWeight.BOLD,
-                            color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
-                            selectable=True,
-                        ),
-                        ft.Text(
-                            "Your Claude Code project looks healthy.",
-                            size=Typography.BODY_MD,
-                            color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                            selectable=True,
-                        ),
-                    ],
-                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    spacing=Spacing.MD,
-                ),
-                padding=Spacing.XL,
-                alignment=ft.alignment.center,
-            )
-        )
+    # The page's results area scrolls, so this column doesn't
+    column = results_column or ft.Column(spacing=Spacing.SM)
+    column.controls = controls
 
-    # Results layout - wrap in SelectionArea to enable text selection
+    # Results layout - the card and header texts are selectable themselves
     return ft.Container(
-        content=ft.SelectionArea(
-            content=ft.Column(
-                controls,
-                spacing=Spacing.SM,
-                scroll=ft.ScrollMode.AUTO,
-            ),
-        ),
+        content=column,
         expand=True,
         padding=Spacing.MD,
     )
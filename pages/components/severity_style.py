@@ -0,0 +1,68 @@
+"""
+Severity Style
+Shared severity display mapping for issue and fix cards
+"""
+
+from dataclasses import dataclass
+from typing import Dict
+
+import flet as ft
+from theme import Colors, with_opacity
+from health_checks.base import Severity
+
+
+# Severity -> (emoji, accent color)
+SEVERITY_STYLE = {
+    Severity.CRITICAL: ("🔴", Colors.RED_500),
+    Severity.WARNING: ("🟡", Colors.YELLOW_500),
+    Severity.INFO: ("🔵", Colors.BLUE_500),
+}
+
+# Translucent severity tints, precomputed once instead of per card
+CARD_BG_LIGHT = {sev: with_opacity(0.02, color) for sev, (_, color) in SEVERITY_STYLE.items()}
+CARD_BG_DARK = {sev: with_opacity(0.05, color) for sev, (_, color) in SEVERITY_STYLE.items()}
+SUGGESTION_BG = {sev: with_opacity(0.03, color) for sev, (_, color) in SEVERITY_STYLE.items()}
+SUGGESTION_BORDER = {sev: with_opacity(0.2, color) for sev, (_, color) in SEVERITY_STYLE.items()}
+
+
+@dataclass(frozen=True)
+class Palette:
+    """Colors for one theme, resolved once instead of a ternary per widget."""
+
+    text: str
+    muted: str
+    border: str  # Card borders and severity header separators
+    card_bg: Dict[Severity, str]  # Translucent severity tint behind a card
+
+
+# is_dark -> Palette
+PALETTE = {
+    False: Palette(
+        text=Colors.TEXT_DARK,
+        muted=Colors.TEXT_DARK_MUTED,
+        border=Colors.LIGHT_BORDER_STRONG,
+        card_bg=CARD_BG_LIGHT,
+    ),
+    True: Palette(
+        text=Colors.TEXT_LIGHT,
+        muted=Colors.TEXT_LIGHT_MUTED,
+        border=Colors.PRIMARY_500,
+        card_bg=CARD_BG_DARK,
+    ),
+}
+
+
+def build_severity_separator(is_dark: bool) -> ft.Container:
+    """
+    Build the thin divider between a card's severity label and rule ID.
+
+    Flet controls can only have one parent, so each card needs its own
+    instance; only the theme color is shared.
+
+    Args:
+        is_dark: Dark mode flag
+
+    Returns:
+        2x12 separator Container
+    """
+    return ft.Container(width=2, height=12, bgcolor=PALETTE[is_dark].border)
@@ -4,26 +4,65 @@ Display issues with actionable fix prompts that can be copied
 """
 
 import flet as ft
-from theme import Colors, Spacing, Radius, Typography, section_header, divider
-from services.app_state import get_last_scan
+from theme import Colors, Spacing, Radius, Typography, section_header, divider, success_icon
+from services.app_state import get_last_scan, get_scan_version
 from health_checks.base import Severity
 from pages.components.fix_card import build_fix_card
-from pages.components.filter_controls import build_filter_controls
+from pages.components.filter_controls import ALL_SEVERITIES, build_filter_controls
+from pages.components.severity_style import SEVERITY_STYLE
 from services.knowledge_service import get_knowledge_service
 
 
+# Batch export text around the per-issue blocks
+_BAR = "=" * 80
+_EXPORT_HEADER = (
+    f"{_BAR}\nCLAUDE CODE FIX PROMPTS - BATCH EXPORT\n{_BAR}\n"
+    "\nProject: {project}\nExported: {exported}\nIssues: {count} selected\n\n"
+)
+_EXPORT_FOOTER = (
+    f"{_BAR}\nEND OF BATCH EXPORT\n{_BAR}\n\n"
+    "Instructions:\n"
+    "1. Copy this entire text block\n"
+    "2. Paste into Claude Code\n"
+    "3. Claude will address each issue systematically\n"
+)
+
+
 class FixPage:
     def __init__(self, page: ft.Page, on_navigate=None):
         self.page = page
         self.on_navigate = on_navigate  # Callback to navigate to other pages
-        self.selected_severity = "All"  # Filter state
+        self.selected_severity = None  # Filter state: Severity, or None for all
         self.sort_by = "severity"  # Sort state: "severity", "title"
-        self.selected_issues = {}  # Dict[issue_id, bool] - track selected issues
+        self.selected_issues = set()  # Set[issue_id] - track selected issues
         self.knowledge_service = get_knowledge_service()
         self.issue_topics_cache = {}  # Cache of issue_rule_id -> has_topics
+        self._is_dark = page.theme_mode == ft.ThemeMode.DARK  # Refreshed in build()
+
+        # Per-scan severity index, rebuilt when the last scan changes
+        self._scan_version = None
+        self._counts = {severity: 0 for severity in Severity}
+        self._sort_cache = {}  # Dict[(severity, sort_by, scan_version), List[HealthIssue]]
+        self._issues_by_id = {}  # Dict[rule_id, (scan position, HealthIssue)]
+
+        # Built fix cards, reused across filter/sort changes
+        self._card_cache = {}  # Dict[rule_id, ft.Control]
+        self._card_cache_key = None  # (scan_version, is_dark) the cache was built for
+        self._empty_cache = {}  # Dict[(has_scan, is_dark), ft.Container]
+
+        # Built page tree, reused on tab re-entry while scan and theme are unchanged
+        self._built = None
+        self._built_key = None  # (scan_version, is_dark)
+
+        # Issues list, created once; filter and sort changes only swap its controls
+        self._issues_list = ft.ListView(
+            spacing=Spacing.MD,
+            expand=True,
+            cache_extent=500,
+        )
 
         # UI components that need updating
-        self.issues_container = ft.Container()
+        self.issues_container = ft.Container(expand=True)
         self.stats_text = ft.Text()
         self.export_button = ft.ElevatedButton(
             "Export Selected (0)",
@@ -31,6 +70,21 @@ class FixPage:
             on_click=self._on_export_selected,
             disabled=True,
         )
+        self._snack_text = ft.Text()
+        self._snack_bar = ft.SnackBar(content=self._snack_text, bgcolor=Colors.GREEN_500)
+
+    def _ensure_index(self, scan_result):
+        """Count issues by severity and reset the sort cache, once per scan."""
+        scan_version = get_scan_version()
+        if scan_version == self._scan_version:
+            return
+
+        self._scan_version = scan_version
+        self._sort_cache.clear()
+        issues = scan_result.issues if scan_result else []
+        self._issues_by_id = {issue.rule_id: (pos, issue) for pos, issue in enumerate(issues)}
+        for severity in Severity:
+            self._counts[severity] = len(scan_result.by_severity[severity]) if scan_result else 0
 
     def _filter_and_sort_issues(self):
         """Filter and sort issues based on current selection."""
@@ -38,52 +92,71 @@ class FixPage:
         if not scan_result:
             return []
 
-        issues = scan_result.issues
-
-        # Filter by severity
-        if self.selected_severity != "All":
-            issues = [i for i in issues if i.severity.value.upper() == self.selected_severity]
-
-        # Sort
-        if self.sort_by == "severity":
-            # CRITICAL > WARNING > INFO
-            severity_order = {Severity.CRITICAL: 0, Severity.WARNING: 1, Severity.INFO: 2}
-            issues = sorted(issues, key=lambda i: severity_order[i.severity])
-        elif self.sort_by == "title":
-            issues = sorted(issues, key=lambda i: i.title.lower())
-
+        self._ensure_index(scan_result)
+
+        severity, sort_by = self.selected_severity, self.sort_by
+        key = (severity, sort_by, self._scan_version)
+        issues = self._sort_cache.get(key)
+        if issues is None:
+            # Buckets and sort orders were built once with the scan result,
+            # so a toggle only ever filters
+            if severity is None:
+                issues = scan_result.sorted_issues[sort_by]
+            elif sort_by == "severity":
+                issues = scan_result.by_severity[severity]
+            else:
+                issues = [
+                    issue for issue in scan_result.sorted_issues[sort_by]
+                    if issue.severity is severity
+                ]
+            self._sort_cache[key] = issues
         return issues
 
     def _on_filter_change(self, e):
         """Handle severity filter change."""
-        self.selected_severity = e.control.value
+        value = e.control.value
+        severity = None if value == ALL_SEVERITIES else Severity(value)
+        if severity is self.selected_severity:
+            return  # Re-selected the current option
+        self.selected_severity = severity
         self._refresh_issues()
 
     def _on_sort_change(self, e):
         """Handle sort order change."""
+        if e.control.value == self.sort_by:
+            return  # Re-selected the current option
         self.sort_by = e.control.value
         self._refresh_issues()
 
     def _copy_to_clipboard(self, text: str, issue_title: str):
         """Copy text to clipboard and show snackbar."""
         self.page.set_clipboard(text)
-        self.page.snack_bar = ft.SnackBar(
-            content=ft.Text(f"Copied fix prompt for: {issue_title}"),
-            bgcolor=Colors.GREEN_500,
-        )
-        self.page.snack_bar.open = True
-        self.page.update()
+        self._show_snack_bar(f"Copied fix prompt for: {issue_title}")
+
+    def _show_snack_bar(self, message: str):
+        """Show a confirmation snackbar without a page-wide update."""
+        self._snack_text.value = message
+        # page.open only updates the snackbar control once it is in the overlay
+        self.page.open(self._snack_bar)
+
+    def _copy_to_clipboard_evt(self, text: str, issue_title: str, e):
+        """Copy button click adapter - ignores the event and copies the prompt."""
+        self._copy_to_clipboard(text, issue_title)
 
-    def _on_issue_selected(self, e, issue):
+    def _on_issue_selected(self, e):
         """Handle issue selection checkbox change."""
-        issue_id = issue.rule_id
-        self.selected_issues[issue_id] = e.control.value
+        issue_id = e.control.data
+        if e.control.value:
+            self.selected_issues.add(issue_id)
+        else:
+            self.selected_issues.discard(issue_id)
 
         # Update export button
-        selected_count = sum(1 for selected in self.selected_issues.values() if selected)
+        selected_count = len(self.selected_issues)
         self.export_button.text = f"Export Selected ({selected_count})"
         self.export_button.disabled = selected_count == 0
-        self.page.update()
+        # Only the button changed; skip the page-wide diff
+        self.export_button.update()
 
     def _on_export_selected(self, e):
         """Export all selected fix prompts to clipboard."""
@@ -91,69 +164,52 @@ class FixPage:
         if not scan_result:
             return
 
-        # Get selected issues
-        selected = [
-            issue for issue in scan_result.issues
-            if self.selected_issues.get(issue.rule_id, False)
-        ]
+        self._ensure_index(scan_result)
+
+        # Get selected issues in scan order, visiting only the selections
+        entries = sorted(
+            self._issues_by_id[rule_id]
+            for rule_id in self.selected_issues
+            if rule_id in self._issues_by_id
+        )
+        selected = [issue for _, issue in entries]
 
         if not selected:
             return
 
         # Build combined export text
-        lines = []
-        lines.append("=" * 80)
-        lines.append("CLAUDE CODE FIX PROMPTS - BATCH EXPORT")
-        lines.append("=" * 80)
-        lines.append(f"\nProject: {scan_result.project_path}")
-        lines.append(f"Exported: {scan_result.scan_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Issues: {len(selected)} selected")
-        lines.append("")
-
+        header = _EXPORT_HEADER.format(
+            project=scan_result.project_path,
+            exported=scan_result.scan_time.strftime('%Y-%m-%d %H:%M:%S'),
+            count=len(selected),
+        )
+        blocks = []
         for i, issue in enumerate(selected, 1):
-            severity_emoji = {"CRITICAL": "🔴", "WARNING": "🟡", "INFO": "🔵"}
-            emoji = severity_emoji.get(issue.severity.value.upper(), "⚪")
-
-            lines.append("")
-            lines.append("=" * 80)
-            lines.append(f"{i}. {emoji} [{issue.severity.value.upper()}] {issue.title}")
-            lines.append("=" * 80)
-            lines.append(f"Rule ID: {issue.rule_id}")
-            lines.append("")
-
-            if issue.fix_prompt:
-                lines.append(issue.fix_prompt.strip())
-            else:
-                lines.append(f"Suggestion: {issue.suggestion}")
-
-            lines.append("")
-
-        lines.append("=" * 80)
-        lines.append("END OF BATCH EXPORT")
-        lines.append("=" * 80)
-        lines.append("")
-        lines.append("Instructions:")
-        lines.append("1. Copy this entire text block")
-        lines.append("2. Paste into Claude Code")
-        lines.append("3. Claude will address each issue systematically")
-        lines.append("")
+            label = issue.severity.label
+            emoji = SEVERITY_STYLE[issue.severity][0]
+            body = issue.fix_prompt.strip() if issue.fix_prompt else f"Suggestion: {issue.suggestion}"
+            blocks.append(
+                f"\n{_BAR}\n{i}. {emoji} [{label}] {issue.title}\n{_BAR}\n"
+                f"Rule ID: {issue.rule_id}\n\n{body}\n\n"
+            )
 
-        combined_text = "\n".join(lines)
+        combined_text = header + "".join(blocks) + _EXPORT_FOOTER
 
         # Copy to clipboard
         self.page.set_clipboard(combined_text)
-        self.page.snack_bar = ft.SnackBar(
-            content=ft.Text(f"Exported {len(selected)} fix prompts to clipboard!"),
-            bgcolor=Colors.GREEN_500,
-        )
-        self.page.snack_bar.open = True
-        self.page.update()
+        self._show_snack_bar(f"Exported {len(selected)} fix prompts to clipboard!")
 
-    def _refresh_issues(self):
-        """Refresh the issues display."""
+    def _refresh_issues(self, push: bool = True):
+        """
+        Refresh the issues display.
+
+        Args:
+            push: Send the changed controls to the client; False while the
+                page is still being built and not yet mounted
+        """
         filtered_issues = self._filter_and_sort_issues()
         scan_result = get_last_scan()
-        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
+        is_dark = self._is_dark
 
         # Update stats
         if scan_result:
@@ -161,57 +217,70 @@ class FixPage:
         else:
             self.stats_text.value = "No scan results"
 
-        # Build issue cards
+        # Drop cached cards when the scan or theme changes
+        cache_key = (get_scan_version(), is_dark)
+        if cache_key != self._card_cache_key:
+            self._card_cache.clear()
+            self._card_cache_key = cache_key
+
         if filtered_issues:
-            issue_cards = []
-            for issue in filtered_issues:
-                # Get severity display info
-                if issue.severity == Severity.CRITICAL:
-                    emoji, color = "🔴", Colors.RED_500
-                elif issue.severity == Severity.WARNING:
-                    emoji, color = "🟡", Colors.YELLOW_500
-                else:
-                    emoji, color = "🔵", Colors.BLUE_500
-
-                issue_card = self._build_fix_card(issue, emoji, color, is_dark)
-                issue_cards.append(issue_card)
-
-            self.issues_container.content = ft.Column(
-                issue_cards,
-                spacing=Spacing.MD,
-                scroll=ft.ScrollMode.AUTO,
-            )
+            # ListView only lays out cards near the viewport
+            self._issues_list.controls = [
+                self._get_card(issue, is_dark) for issue in filtered_issues
+            ]
+            self.issues_container.content = self._issues_list
         else:
             # No issues to show
-            self.issues_container.content = ft.Container(
-                content=ft.Column(
-                    [
-                        ft.Icon(
-                            ft.Icons.CHECK_CIRCLE_ROUNDED,
-                            size=64,
-                            color=Colors.GREEN_500,
-                        ),
-                        ft.Text(
-                            "No Issues Match Filter" if scan_result else "No Scan Results",
-                            size=Typography.H2,
-                            weight=ft.FontWeight.BOLD,
-                            color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
-                        ),
-                        ft.Text(
-                            "Try adjusting your filters or run a health scan first." if scan_result else "Run a health scan from the Scan tab to see issues here.",
-                            size=Typography.BODY_MD,
-                            color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                            text_align=ft.TextAlign.CENTER,
-                        ),
-                    ],
-                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    spacing=Spacing.MD,
-                ),
-                padding=Spacing.XL,
-                alignment=ft.alignment.center,
-            )
-
-        self.page.update()
+            self.issues_container.content = self._empty_state(scan_result is not None, is_dark)
+
+        if push:
+            # Only the stats line and the issues list change
+            self.stats_text.update()
+            self.issues_container.update()
+
+    def _get_card(self, issue, is_dark: bool) -> ft.Control:
+        """Return the fix card for an issue, reusing any already built for this scan."""
+        issue_card = self._card_cache.get(issue.rule_id)
+        if issue_card is None:
+            emoji, color = SEVERITY_STYLE[issue.severity]
+            issue_card = self._build_fix_card(issue, emoji, color, is_dark)
+            self._card_cache[issue.rule_id] = issue_card
+        return issue_card
+
+    def _empty_state(self, has_scan: bool, is_dark: bool) -> ft.Container:
+        """Return the cached empty-state panel for this scan/theme combination."""
+        key = (has_scan, is_dark)
+        if key not in self._empty_cache:
+            self._empty_cache[key] = self._build_empty_state(has_scan, is_dark)
+        return self._empty_cache[key]
+
+    def _build_empty_state(self, has_scan: bool, is_dark: bool) -> ft.Container:
+        """Build the panel shown when no issues match the current filter."""
+        text_color = Colors.TEXT_LIGHT if is_dark else Colors.TEXT_DARK
+        muted_color = Colors.TEXT_LIGHT_MUTED if is_dark else Colors.TEXT_DARK_MUTED
+        return ft.Container(
+            content=ft.Column(
+                [
+                    success_icon(),
+                    ft.Text(
+                        "No Issues Match Filter" if has_scan else "No Scan Results",
+                        size=Typography.H2,
+                        weight=ft.FontWeight.BOLD,
+                        color=text_color,
+                    ),
+                    ft.Text(
+                        "Try adjusting your filters or run a health scan first." if has_scan else "Run a health scan from the Scan tab to see issues here.",
+                        size=Typography.BODY_MD,
+                        color=muted_color,
+                        text_align=ft.TextAlign.CENTER,
+                    ),
+                ],
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                spacing=Spacing.MD,
+            ),
+            padding=Spacing.XL,
+            alignment=ft.alignment.center,
+        )
 
     def _check_has_knowledge_topics(self, issue_rule_id: str) -> bool:
         """Check if an issue has related knowledge topics."""
@@ -243,7 +312,7 @@ class FixPage:
             is_dark=is_dark,
             selected_issues=self.selected_issues,
             on_issue_selected=self._on_issue_selected,
-            on_copy_to_clipboard=self._copy_to_clipboard,
+            on_copy_to_clipboard=self._copy_to_clipboard_evt,
             on_learn_more=self._on_learn_more if self.on_navigate else None,
             has_knowledge_topics=has_topics,
         )
@@ -251,19 +320,21 @@ class FixPage:
     def build(self) -> ft.Control:
         """Build fix page."""
         scan_result = get_last_scan()
-        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
+        # Theme only changes on the Settings page, which rebuilds pages on return
+        self._is_dark = self.page.theme_mode == ft.ThemeMode.DARK
+        is_dark = self._is_dark
+
+        # Only issues_container changes while the page is shown, so reuse the
+        # whole tree until a new scan arrives or the theme changes
+        build_key = (get_scan_version(), is_dark)
+        if self._built is not None and build_key == self._built_key:
+            return self._built
 
         # Count issues by severity
-        critical_count = 0
-        warning_count = 0
-        info_count = 0
-        if scan_result:
-            critical_count = sum(1 for i in scan_result.issues if i.severity == Severity.CRITICAL)
-            warning_count = sum(1 for i in scan_result.issues if i.severity == Severity.WARNING)
-            info_count = sum(1 for i in scan_result.issues if i.severity == Severity.INFO)
+        self._ensure_index(scan_result)
 
         # Prepare issues display
-        self._refresh_issues()
+        self._refresh_issues(push=False)
 
         # Build controls
         content = ft.Container(
@@ -280,9 +351,9 @@ class FixPage:
                     divider(is_dark=is_dark),
                     # Filters and sort
                     build_filter_controls(
-                        critical_count=critical_count,
-                        warning_count=warning_count,
-                        info_count=info_count,
+                        critical_count=self._counts[Severity.CRITICAL],
+                        warning_count=self._counts[Severity.WARNING],
+                        info_count=self._counts[Severity.INFO],
                         on_filter_change=self._on_filter_change,
                         on_sort_change=self._on_sort_change,
                         export_button=self.export_button,
@@ -298,10 +369,12 @@ class FixPage:
                     ),
                 ],
                 spacing=0,
-                scroll=ft.ScrollMode.AUTO,
+                # The issues ListView scrolls itself; it needs a bounded height
                 expand=True,
             ),
             expand=True,
         )
 
+        self._built = content
+        self._built_key = build_key
         return content
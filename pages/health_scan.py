@@ -3,20 +3,66 @@ Health Scan Page for Claude Code Coach
 Scan Claude Code projects for health issues
 """
 
+import asyncio
+import atexit
+import time
 import flet as ft
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from theme import Colors, Spacing, Radius, Typography, section_header, divider
-from services.project_scanner import get_project_scanner
+from services.project_scanner import DirectoryListing, get_project_scanner
 from services.health_checker import get_health_checker
+from services.scan_cache import get_scan_cache
 from services.app_state import set_last_scan, set_wizard_path, ScanResult
 from services.tech_stack_analyzer import get_tech_stack_analyzer
 from services.status_updater import get_status_updater
+from services.logging_config import get_logger
 from health_checks.base import Severity
-from utils.platform_specific import pick_folder, save_file_dialog
+from utils.platform_specific import pick_folder_async, save_file_dialog_async
 from utils.report_formatter import format_health_report
-from pages.components.issue_card import build_issue_card
-from pages.components.scan_results import build_scan_results, build_not_claude_project
+from pages.components.issue_card import IssueCard
+from pages.components.severity_style import PALETTE
+from pages.components.scan_results import (
+    ScoreHeader,
+    build_no_issues_panel,
+    build_not_claude_project,
+    build_scan_results,
+)
+
+logger = get_logger(__name__)
+
+# Minimum seconds between page updates while check results stream in
+_STREAM_UPDATE_INTERVAL = 0.1
+
+# Blocking scan work (filesystem walks, detectors, status.md writes) runs here
+# so the event loop keeps animating the progress ring; reused across scans
+_SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="health-scan")
+atexit.register(_SCAN_EXECUTOR.shutdown, wait=False)
+
+
+def _write_report(file_path: Path, report_text: str):
+    """Write report text to file, creating the parent directory only if it is missing."""
+    try:
+        file_path.write_text(report_text, encoding='utf-8')
+    except FileNotFoundError:
+        # The save dialog returns an existing folder, so this is the rare path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(report_text, encoding='utf-8')
+
+
+def _lookup_cached(project_info, use_cache: bool):
+    """Fingerprint the project and return (fingerprint, stored report or None)."""
+    cache = get_scan_cache()
+    # Fingerprint before checking, so edits made mid-scan invalidate the entry
+    fingerprint = cache.fingerprint(project_info.path)
+    if not use_cache:
+        return fingerprint, None
+    return fingerprint, cache.get(project_info.path, fingerprint)
+
+
+# Queue sentinel marking the end of a streamed check run
+_CHECKS_DONE = object()
 
 
 class HealthScanPage:
@@ -25,6 +71,7 @@ class HealthScanPage:
         self.on_navigate = on_navigate
         self.selected_path = None
         self.health_report = None
+        self._report_text = None  # (health_report, formatted report text)
 
         # UI components that need updating
         self.path_display = ft.Text(
@@ -40,75 +87,170 @@ class HealthScanPage:
             on_click=self._on_scan_click,
         )
         self.results_container = ft.Container()
-
-    def _on_pick_directory(self, e):
+        self._score_header = ScoreHeader()  # Reused across scans
+        self._scan_in_flight = False  # True from scan start until it has wound down
+        self._scan_idle = asyncio.Event()  # Set whenever no scan is running
+        self._scan_idle.set()
+        self._scan_token = None  # Identifies the scan whose results may be shown
+        self._panel_cache = {}  # Dict[(panel name, is_dark), ft.Container]
+        self._issue_card_pool = []  # IssueCards reused across rescans
+        self._pool_index = 0  # Next free card while results are being built
+        self._results_column = ft.Column(spacing=Spacing.SM)  # Reused across scans
+        self._results_view = None  # Last container from _build_results
+        self._results_dark = None  # Theme _results_view was built for
+        self._scan_status = None  # Progress text while a scan runs
+        self._live_column = None  # Issues listed while checks are still running
+        self._setup_prompt = self._build_setup_prompt()  # Theme-independent, built once
+        self._scaffold = None  # Page layout from the last build()
+        self._scaffold_dark = None  # Theme _scaffold was built for
+        self._refresh_theme()  # Refreshed again in build()
+
+    def _refresh_theme(self):
+        """
+        Resolve theme-dependent values once.
+
+        The theme only changes on the Settings page, and navigating back
+        rebuilds this page, so build() is the one place this needs to run.
+        """
+        self._is_dark = self.page.theme_mode == ft.ThemeMode.DARK
+        self._palette = PALETTE[self._is_dark]
+
+    async def _on_pick_directory(self, e):
         """Open folder picker and update UI with selected path."""
-        selected_folder = pick_folder()
+        selected_folder = await pick_folder_async()
 
         if selected_folder:
+            # A scan of the previous folder is now stale
+            self._scan_token = None
             self.selected_path = selected_folder
-            is_dark = self.page.theme_mode == ft.ThemeMode.DARK
-
-            self.path_display.value = str(self.selected_path)
+            self.path_display.value = str(selected_folder)
             self.path_display.italic = False
-            self.path_display.color = Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT
+            self.path_display.color = self._palette.text
             self.scan_button.disabled = False
 
             # Clear previous results
             self.results_container.content = None
             self.health_report = None
+            self._report_text = None
 
             self.page.update()
 
-    def _on_scan_click(self, e):
+    async def _on_scan_click(self, e):
         """Handle scan button click"""
+        await self._start_scan(use_cache=True)
+
+    async def force_rescan(self):
+        """Rescan the selected project, ignoring any cached report."""
+        await self._start_scan(use_cache=False)
+
+    async def _start_scan(self, use_cache: bool):
+        """Show progress and scan the selected project."""
         if not self.selected_path:
             return
 
-        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
+        # The latest request wins: stop any running scan and wait for it to wind down
+        while self._scan_in_flight:
+            self._scan_token = None
+            await self._scan_idle.wait()
+
+        token = self._scan_token = object()
+        self._scan_in_flight = True
+        self._scan_idle.clear()
+        self._report_text = None
+        self.scan_button.disabled = True
+        self.scan_button.tooltip = "Scan in progress…"
+        try:
+            self._show_scanning()
+            await self._run_scan(self.selected_path, use_cache, token)
+        finally:
+            self._scan_in_flight = False
+            self._scan_idle.set()
+            self.scan_button.disabled = False
+            self.scan_button.tooltip = None
+            # A superseded scan leaves the page to whatever replaced it
+            if self._scan_token is token:
+                # Results and the re-enabled button go out in one update
+                self.page.update()
+
+    def _show_scanning(self):
+        """Replace the results with a progress indicator (also pushes the disabled scan button)."""
+        self._scan_status = ft.Text(
+            "Scanning project...",
+            size=Typography.BODY_MD,
+            color=self._palette.muted,
+        )
+        # Issues found so far are listed under the spinner as checks finish
+        self._live_column = ft.Column(spacing=Spacing.SM)
 
         # Show loading state
-        self.results_container.content = ft.Container(
-            content=ft.Column(
-                [
-                    ft.ProgressRing(),
-                    ft.Text(
-                        "Scanning project...",
-                        size=Typography.BODY_MD,
-                        color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
+        self.results_container.content = ft.Column(
+            [
+                ft.Container(
+                    content=ft.Column(
+                        [ft.ProgressRing(), self._scan_status],
+                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                        spacing=Spacing.MD,
                     ),
-                ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                spacing=Spacing.MD,
-            ),
-            padding=Spacing.XL,
-            alignment=ft.alignment.center,
+                    padding=Spacing.XL,
+                    alignment=ft.alignment.center,
+                ),
+                ft.Container(content=self._live_column, padding=Spacing.MD),
+            ],
+            spacing=0,
         )
         self.page.update()
 
-        # Run the scan
+    async def _run_scan(self, project_path, use_cache: bool = True, token=None):
+        """
+        Scan a project in the executor and set the outcome; the caller pushes the update.
+
+        Stops without touching the results once self._scan_token is no longer token.
+        """
+        loop = asyncio.get_running_loop()
+
+        # One top-level listing serves both the scanner and the analyzer
+        listing = await loop.run_in_executor(_SCAN_EXECUTOR, DirectoryListing, project_path)
+
         scanner = get_project_scanner()
-        project_info = scanner.scan_directory(self.selected_path)
+        project_info = await loop.run_in_executor(
+            _SCAN_EXECUTOR, scanner.scan_directory, project_path, listing
+        )
 
         if not project_info:
             # No .claude/ found - check if it's a valid code project
             analyzer = get_tech_stack_analyzer()
-            tech_info = analyzer.analyze_directory(self.selected_path)
+            tech_info = await loop.run_in_executor(
+                _SCAN_EXECUTOR, analyzer.analyze_directory, project_path, listing
+            )
             is_valid, reason = analyzer.is_valid_code_project(tech_info)
+            if self._scan_token is not token:
+                return
 
             if is_valid:
                 # Valid code project without .claude - offer to set up CC
-                self.results_container.content = self._build_setup_prompt()
+                self.results_container.content = self._setup_prompt
             else:
                 # Not a code project at all
-                self.results_container.content = self._build_not_claude_project()
+                self.results_container.content = self._panel("not_claude", self._build_not_claude_project)
         else:
-            # Run health checks
-            checker = get_health_checker()
-            self.health_report = checker.check_project(
-                project_info.path,
-                project_info.parsed_config
+            # Run health checks, unless the project is unchanged since a stored scan
+            fingerprint, report = await loop.run_in_executor(
+                _SCAN_EXECUTOR, _lookup_cached, project_info, use_cache
             )
+            if report is None:
+                report = await self._stream_checks(project_info, token)
+                if report is None:
+                    return  # Superseded mid-scan
+                await loop.run_in_executor(
+                    _SCAN_EXECUTOR,
+                    get_scan_cache().put,
+                    project_info.path,
+                    fingerprint,
+                    report,
+                )
+            if self._scan_token is not token:
+                return
+            self.health_report = report
 
             # Store scan results in app state for Fix page
             scan_result = ScanResult(
@@ -122,69 +264,164 @@ class HealthScanPage:
 
             # Update status.md with scan results
             updater = get_status_updater()
-            updater.append_scan_result(
+            await loop.run_in_executor(
+                _SCAN_EXECUTOR,
+                updater.append_scan_result,
                 project_info.path,
                 self.health_report.score,
-                len(self.health_report.issues)
+                len(self.health_report.issues),
             )
 
             self.results_container.content = self._build_results()
 
-        self.page.update()
+    async def _stream_checks(self, project_info, token=None):
+        """
+        Run the health checks, listing each issue under the spinner as it arrives.
+
+        Returns:
+            HealthReport for the project, or None if the scan was superseded
+            (self._scan_token no longer token) before the checks finished
+        """
+        loop = asyncio.get_running_loop()
+        checker = get_health_checker()
+        queue = asyncio.Queue()
+
+        def produce():
+            checks = checker.iter_check_project(project_info.path, project_info.parsed_config)
+            try:
+                for result in checks:
+                    if self._scan_token is not token:
+                        break  # Superseded; stop before waiting on later detectors
+                    loop.call_soon_threadsafe(queue.put_nowait, result)
+            finally:
+                checks.close()  # Cancels detectors that haven't started
+                loop.call_soon_threadsafe(queue.put_nowait, _CHECKS_DONE)
+
+        producer = loop.run_in_executor(_SCAN_EXECUTOR, produce)
+
+        issues = []
+        detectors_run = 0
+        total = len(checker.detectors)
+        self._pool_index = 0
+        last_update = loop.time()
+        pending = False  # Cards or counts changed since the last update
+        while True:
+            # With changes pending, wait only until the next update is due
+            timeout = None
+            if pending:
+                timeout = max(0.0, _STREAM_UPDATE_INTERVAL - (loop.time() - last_update))
+            try:
+                batch = [await asyncio.wait_for(queue.get(), timeout)]
+            except asyncio.TimeoutError:
+                batch = []
+            else:
+                # Take everything that arrived since the last wake-up in one batch
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+            if _CHECKS_DONE in batch:
+                batch = batch[:batch.index(_CHECKS_DONE)]
+                done = True
+            else:
+                done = False
+
+            for result in batch:
+                detectors_run += 1
+                if result is not None:
+                    issues.append(result)
+                    self._live_column.controls.append(
+                        self._build_issue_card(result, self._is_dark)
+                    )
+                pending = True
+
+            if done or self._scan_token is not token:
+                # The final results replace this view in the caller's update
+                break
+            if pending and loop.time() - last_update >= _STREAM_UPDATE_INTERVAL:
+                # Throttle: at most one update per interval however fast results arrive
+                self._scan_status.value = f"Scanning project... {detectors_run}/{total} checks"
+                self.page.update()
+                last_update = loop.time()
+                pending = False
+
+        await producer  # Re-raise anything the producer thread hit
+        # The pooled cards move into the final results
+        self._live_column.controls = []
+        if self._scan_token is not token:
+            return None
+        return checker.build_report(project_info.path, issues, detectors_run)
+
+    def _panel(self, name: str, build_fn) -> ft.Container:
+        """Return a static results panel, building it once per theme."""
+        key = (name, self._is_dark)
+        if key not in self._panel_cache:
+            self._panel_cache[key] = build_fn()
+        return self._panel_cache[key]
 
     def _build_not_claude_project(self):
         """Build UI for non-Claude Code project"""
-        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
-        return build_not_claude_project(is_dark)
+        return build_not_claude_project(self._is_dark)
+
+    def _no_issues_panel(self, is_dark: bool) -> ft.Container:
+        """Return the all-clear panel, building it once per theme."""
+        return self._panel("no_issues", lambda: build_no_issues_panel(is_dark))
 
     def _build_results(self):
         """Build health scan results UI"""
-        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
-        return build_scan_results(
+        self._pool_index = 0
+        results = build_scan_results(
             health_report=self.health_report,
-            is_dark=is_dark,
+            is_dark=self._is_dark,
             build_issue_card_fn=self._build_issue_card,
             on_save_report=self._on_save_report,
+            score_header=self._score_header,
+            results_column=self._results_column,
+            build_no_issues_panel_fn=self._no_issues_panel,
         )
-
-    def _build_issue_card(self, issue, emoji: str, color: str, is_dark: bool):
-        """Build a card for a single issue"""
-        return build_issue_card(issue, emoji, color, is_dark)
-
-    def _format_report_as_text(self) -> str:
-        """Format the health report as plain text for export."""
-        return format_health_report(self.health_report)
-
-    def _on_save_report(self, e):
+        # Drop cards left over from a scan with more issues
+        del self._issue_card_pool[self._pool_index:]
+        self._results_view = results
+        self._results_dark = self._is_dark
+        return results
+
+    def _build_issue_card(self, issue, is_dark: bool):
+        """Build a card for a single issue, reusing a pooled card when one is free"""
+        if self._pool_index < len(self._issue_card_pool):
+            card = self._issue_card_pool[self._pool_index]
+        else:
+            card = IssueCard()
+            self._issue_card_pool.append(card)
+        self._pool_index += 1
+        return card.update(issue, is_dark)
+
+    def _get_report_text(self) -> str:
+        """Return the formatted report, formatting it only once per scan."""
+        cached = self._report_text
+        if cached is None or cached[0] is not self.health_report:
+            cached = (self.health_report, format_health_report(self.health_report))
+            self._report_text = cached
+        return cached[1]
+
+    async def _on_save_report(self, e):
         """Handle save report button click - open file picker and save report."""
         if not self.health_report:
             return
 
         try:
-            # Generate default filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_name = f"health_report_{timestamp}.txt"
+            # Generate default filename with timestamp (field formatting, not locale-aware strftime)
+            t = time.localtime()
+            default_name = (
+                f"health_report_{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}"
+                f"_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}.txt"
+            )
 
-            # Open save dialog
-            file_path = save_file_dialog(default_name)
+            # Open save dialog; the loop keeps running until the user answers
+            file_path = await save_file_dialog_async(default_name)
 
             if file_path:
-                # Format and save the report
-                report_text = self._format_report_as_text()
+                await asyncio.to_thread(_write_report, file_path, self._get_report_text())
 
-                print(f"Report text length: {len(report_text)} characters")
-                print(f"Attempting to save to: {file_path}")
-
-                # Ensure parent directory exists
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Write report to file
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(report_text)
-
-                print(f"File saved successfully to: {file_path}")
-                if file_path.exists():
-                    print(f"File size: {file_path.stat().st_size} bytes")
+                logger.debug(f"Report saved to: {file_path}")
 
                 # Show success message
                 self.page.snack_bar = ft.SnackBar(
@@ -195,9 +432,7 @@ class HealthScanPage:
                 self.page.update()
 
         except Exception as ex:
-            print(f"Failed to save report - Exception: {str(ex)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Failed to save report")
             self.page.snack_bar = ft.SnackBar(
                 content=ft.Text(f"Error saving report: {str(ex)}"),
                 bgcolor=Colors.RED_500,
@@ -207,8 +442,6 @@ class HealthScanPage:
 
     def _build_setup_prompt(self) -> ft.Container:
         """Build UI prompting user to run setup wizard"""
-        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
-
         return ft.Container(
             content=ft.Column([
                 ft.Icon(ft.Icons.FOLDER_ROUNDED, size=64, color=Colors.ACCENT_500),
@@ -231,12 +464,12 @@ class HealthScanPage:
                 ft.Row([
                     ft.ElevatedButton(
                         "No, Cancel",
-                        on_click=lambda e: self._clear_results()
+                        on_click=self._on_cancel_setup,
                     ),
                     ft.ElevatedButton(
                         "Yes, Set Up Claude Code",
                         icon=ft.Icons.ROCKET_LAUNCH_ROUNDED,
-                        on_click=lambda e: self._navigate_to_wizard(),
+                        on_click=self._on_start_setup,
                         bgcolor=Colors.ACCENT_500,
                     ),
                 ], alignment=ft.MainAxisAlignment.CENTER, spacing=Spacing.MD),
@@ -245,6 +478,14 @@ class HealthScanPage:
             alignment=ft.alignment.center,
         )
 
+    def _on_cancel_setup(self, e):
+        """Handle "No, Cancel" on the setup prompt"""
+        self._clear_results()
+
+    def _on_start_setup(self, e):
+        """Handle "Yes, Set Up Claude Code" on the setup prompt"""
+        self._navigate_to_wizard()
+
     def _navigate_to_wizard(self):
         """Navigate to wizard tab and pass selected path"""
         # Store path in app_state for wizard to pick up
@@ -257,12 +498,33 @@ class HealthScanPage:
     def _clear_results(self):
         """Clear scan results"""
         self.results_container.content = None
-        self.page.update()
+        # Only the results area changed, so don't diff the whole page
+        self.results_container.update()
 
     def build(self) -> ft.Control:
         """Build health scan page"""
-        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
+        self._refresh_theme()
+        is_dark = self._is_dark
+
+        # Results built under the other theme are re-pointed, not rebuilt: the
+        # pooled cards and score header only restyle
+        if (
+            self._results_view is not None
+            and self.results_container.content is self._results_view
+            and self._results_dark != is_dark
+            and not self._scan_in_flight
+        ):
+            self.results_container.content = self._build_results()
+
+        # The scaffold only depends on the theme; results swap inside it
+        if self._scaffold is None or self._scaffold_dark != is_dark:
+            self._scaffold = self._build_scaffold(is_dark)
+            self._scaffold_dark = is_dark
 
+        return self._scaffold
+
+    def _build_scaffold(self, is_dark: bool) -> ft.Control:
+        """Build the header, directory picker and results area for a theme."""
         # Main content
         content = ft.Container(
             content=ft.Column(
@@ -292,7 +554,7 @@ class HealthScanPage:
                                             "SELECT PROJECT",
                                             size=Typography.CAPTION,
                                             weight=ft.FontWeight.BOLD,
-                                            color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
+                                            color=self._palette.muted,
                                         ),
                                     ],
                                     spacing=Spacing.SM,
@@ -317,11 +579,18 @@ class HealthScanPage:
                         padding=Spacing.MD,
                     ),
                     ft.Container(height=Spacing.MD),
-                    # Results area
-                    self.results_container,
+                    # Results area - the only part that scrolls, so swapping its
+                    # content doesn't re-measure the header and picker
+                    ft.Container(
+                        content=ft.Column(
+                            [self.results_container],
+                            scroll=ft.ScrollMode.AUTO,
+                            expand=True,
+                        ),
+                        expand=True,
+                    ),
                 ],
                 spacing=0,
-                scroll=ft.ScrollMode.AUTO,
                 expand=True,
             ),
             expand=True,
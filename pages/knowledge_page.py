@@ -3,10 +3,19 @@ Knowledge Page for Claude Code Coach
 Browse and search the knowledge base
 """
 
+import asyncio
+from collections import OrderedDict
+
 import flet as ft
 from theme import Colors, Spacing, Radius, Typography, section_header, divider
 from services.knowledge_service import get_knowledge_service, Topic, SearchResult
 
+_SEARCH_LIMIT = 20  # Results per search
+_RECENT_LIMIT = 20  # Topics listed under "All Topics"
+_SEARCH_CACHE_SIZE = 64  # Recent queries whose results are kept
+_SEARCH_DEBOUNCE = 0.3  # Seconds of typing pause before searching
+_PAGE_SIZE = 10  # Topic cards shown per page of the results list
+
 
 class KnowledgePage:
     def __init__(self, page: ft.Page):
@@ -17,12 +26,20 @@ class KnowledgePage:
         self.current_topic: Topic = None
         self.search_results: list[SearchResult] = []
         self.selected_category: str = None
+        # The knowledge base doesn't change while the app runs, so lookups are kept
+        self._search_cache = OrderedDict()  # (casefolded query, limit) -> list[SearchResult]
+        self._categories = None  # get_all_categories() result
+        self._recent_topics = None  # get_recent_topics() result
+        self._search_generation = 0  # Bumped per keystroke; a pending search runs only if still current
+        self._listed = []  # (topic, snippet or None) for every entry in the results list
+        self._page_index = 0  # Page of _listed currently shown
 
         # UI components
         self.search_field = ft.TextField(
             hint_text="Search knowledge base...",
             prefix_icon=ft.Icons.SEARCH_ROUNDED,
             on_submit=self._on_search,
+            on_change=self._on_search_change,
             expand=True,
         )
 
@@ -53,7 +70,9 @@ class KnowledgePage:
 
     def _load_categories(self):
         """Load category chips"""
-        categories = self.knowledge_service.get_all_categories()
+        if self._categories is None:
+            self._categories = self.knowledge_service.get_all_categories()
+        categories = self._categories
         is_dark = self.page.theme_mode == ft.ThemeMode.DARK
 
         chips = []
@@ -100,14 +119,44 @@ class KnowledgePage:
             self._display_topic_list(topics)
         else:
             # Show all recent topics
-            topics = self.knowledge_service.get_recent_topics(limit=20)
-            self._display_topic_list(topics)
+            self._display_topic_list(self._get_recent_topics())
 
         self._load_categories()  # Update chip selection
         self.page.update()
 
+    def _get_recent_topics(self) -> list[Topic]:
+        """Return the recent topics, querying the knowledge base once."""
+        if self._recent_topics is None:
+            self._recent_topics = self.knowledge_service.get_recent_topics(limit=_RECENT_LIMIT)
+        return self._recent_topics
+
+    def _cached_search(self, query: str) -> list[SearchResult]:
+        """Search the knowledge base, reusing results for recently seen queries."""
+        # Full-text matching ignores case, so queries differing only in case share an entry
+        key = (query.casefold(), _SEARCH_LIMIT)
+        results = self._search_cache.get(key)
+        if results is not None:
+            self._search_cache.move_to_end(key)
+            return results
+
+        results = self.knowledge_service.search(query, limit=_SEARCH_LIMIT)
+        self._search_cache[key] = results
+        if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return results
+
+    async def _on_search_change(self, e):
+        """Search once typing pauses, rather than on every keystroke."""
+        self._search_generation += 1
+        generation = self._search_generation
+        await asyncio.sleep(_SEARCH_DEBOUNCE)
+        if generation == self._search_generation:
+            self._on_search(e)
+
     def _on_search(self, e):
         """Handle search submission"""
+        # A submit makes any pending debounced search redundant
+        self._search_generation += 1
         query = self.search_field.value.strip()
 
         if not query:
@@ -115,7 +164,7 @@ class KnowledgePage:
             return
 
         # Perform search
-        self.search_results = self.knowledge_service.search(query, limit=20)
+        self.search_results = self._cached_search(query)
 
         if self.search_results:
             self._display_search_results()
@@ -126,67 +175,14 @@ class KnowledgePage:
 
     def _display_search_results(self):
         """Display search results in left pane"""
-        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
-
-        results = []
-        for result in self.search_results:
-            topic = result.topic
-
-            card = ft.Container(
-                content=ft.Column(
-                    [
-                        ft.Text(
-                            topic.title,
-                            size=Typography.BODY_MD,
-                            weight=ft.FontWeight.BOLD,
-                            color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
-                        ),
-                        ft.Text(
-                            result.snippet,
-                            size=Typography.BODY_SM,
-                            color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                            max_lines=2,
-                            overflow=ft.TextOverflow.ELLIPSIS,
-                        ),
-                        ft.Row(
-                            [
-                                ft.Container(
-                                    content=ft.Text(
-                                        topic.category.replace("-", " ").title(),
-                                        size=Typography.TINY,
-                                        color=Colors.ACCENT_500,
-                                    ),
-                                    padding=ft.padding.symmetric(horizontal=Spacing.SM, vertical=2),
-                                    bgcolor=ft.Colors.with_opacity(0.1, Colors.ACCENT_500),
-                                    border_radius=Radius.SM,
-                                ),
-                                ft.Text(
-                                    f"• {topic.difficulty}",
-                                    size=Typography.TINY,
-                                    color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                                ),
-                            ],
-                            spacing=Spacing.SM,
-                        ),
-                    ],
-                    spacing=Spacing.XS,
-                ),
-                padding=Spacing.MD,
-                border=ft.border.all(1, Colors.LIGHT_BORDER if not is_dark else Colors.PRIMARY_600),
-                border_radius=Radius.MD,
-                ink=True,
-                on_click=lambda e, t=topic: self._on_topic_select(t),
-            )
-
-            results.append(card)
-
-        self.results_list.controls = results
+        self._show_listing([(result.topic, result.snippet) for result in self.search_results])
 
     def _display_topic_list(self, topics: list[Topic]):
         """Display topic list in left pane"""
         is_dark = self.page.theme_mode == ft.ThemeMode.DARK
 
         if not topics:
+            self._listed = []
             self.results_list.controls = [
                 ft.Container(
                     content=ft.Text(
@@ -200,36 +196,120 @@ class KnowledgePage:
             ]
             return
 
-        cards = []
-        for topic in topics:
-            card = ft.Container(
-                content=ft.Column(
+        self._show_listing([(topic, None) for topic in topics])
+
+    def _show_listing(self, listed: list[tuple]):
+        """Show a new listing in the left pane, starting from its first page."""
+        self._listed = listed
+        self._page_index = 0
+        self._render_page()
+
+    def _render_page(self):
+        """Build cards for the current page only, plus a pager when there's more than one page."""
+        start = self._page_index * _PAGE_SIZE
+        controls = [
+            self._build_topic_card(topic, snippet)
+            for topic, snippet in self._listed[start:start + _PAGE_SIZE]
+        ]
+
+        page_count = -(-len(self._listed) // _PAGE_SIZE)
+        if page_count > 1:
+            is_dark = self.page.theme_mode == ft.ThemeMode.DARK
+            controls.append(
+                ft.Row(
                     [
-                        ft.Text(
-                            topic.title,
-                            size=Typography.BODY_MD,
-                            weight=ft.FontWeight.BOLD,
-                            color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
+                        ft.IconButton(
+                            ft.Icons.CHEVRON_LEFT,
+                            disabled=self._page_index == 0,
+                            on_click=lambda e: self._goto_page(-1),
                         ),
                         ft.Text(
-                            topic.summary,
+                            f"Page {self._page_index + 1} of {page_count}",
                             size=Typography.BODY_SM,
                             color=Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED,
-                            max_lines=2,
-                            overflow=ft.TextOverflow.ELLIPSIS,
+                        ),
+                        ft.IconButton(
+                            ft.Icons.CHEVRON_RIGHT,
+                            disabled=self._page_index == page_count - 1,
+                            on_click=lambda e: self._goto_page(1),
                         ),
                     ],
-                    spacing=Spacing.XS,
-                ),
-                padding=Spacing.MD,
-                border=ft.border.all(1, Colors.LIGHT_BORDER if not is_dark else Colors.PRIMARY_600),
-                border_radius=Radius.MD,
-                ink=True,
-                on_click=lambda e, t=topic: self._on_topic_select(t),
+                    alignment=ft.MainAxisAlignment.CENTER,
+                    spacing=Spacing.SM,
+                )
+            )
+
+        self.results_list.controls = controls
+
+    def _goto_page(self, delta: int):
+        """Move the results list delta pages forward or back."""
+        page_count = -(-len(self._listed) // _PAGE_SIZE)
+        self._page_index = max(0, min(self._page_index + delta, page_count - 1))
+        self._render_page()
+        self.results_list.update()
+
+    def _build_topic_card(self, topic: Topic, snippet: str = None) -> ft.Container:
+        """
+        Build a results list card for a topic.
+
+        Args:
+            topic: Topic to show
+            snippet: Search snippet; when given, shown with the topic's category
+                and difficulty instead of its summary
+
+        Returns:
+            Clickable card that opens the topic
+        """
+        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
+        muted_color = Colors.TEXT_DARK_MUTED if not is_dark else Colors.TEXT_LIGHT_MUTED
+
+        controls = [
+            ft.Text(
+                topic.title,
+                size=Typography.BODY_MD,
+                weight=ft.FontWeight.BOLD,
+                color=Colors.TEXT_DARK if not is_dark else Colors.TEXT_LIGHT,
+            ),
+            ft.Text(
+                snippet if snippet is not None else topic.summary,
+                size=Typography.BODY_SM,
+                color=muted_color,
+                max_lines=2,
+                overflow=ft.TextOverflow.ELLIPSIS,
+            ),
+        ]
+        if snippet is not None:
+            controls.append(
+                ft.Row(
+                    [
+                        ft.Container(
+                            content=ft.Text(
+                                topic.category.replace("-", " ").title(),
+                                size=Typography.TINY,
+                                color=Colors.ACCENT_500,
+                            ),
+                            padding=ft.padding.symmetric(horizontal=Spacing.SM, vertical=2),
+                            bgcolor=ft.Colors.with_opacity(0.1, Colors.ACCENT_500),
+                            border_radius=Radius.SM,
+                        ),
+                        ft.Text(
+                            f"• {topic.difficulty}",
+                            size=Typography.TINY,
+                            color=muted_color,
+                        ),
+                    ],
+                    spacing=Spacing.SM,
+                )
             )
-            cards.append(card)
 
-        self.results_list.controls = cards
+        return ft.Container(
+            content=ft.Column(controls, spacing=Spacing.XS),
+            padding=Spacing.MD,
+            border=ft.border.all(1, Colors.LIGHT_BORDER if not is_dark else Colors.PRIMARY_600),
+            border_radius=Radius.MD,
+            ink=True,
+            on_click=lambda e, t=topic: self._on_topic_select(t),
+        )
 
     def _display_no_results(self):
         """Display no results message"""
@@ -551,7 +631,6 @@ class KnowledgePage:
         )
 
         # Show recent topics initially
-        topics = self.knowledge_service.get_recent_topics(limit=20)
-        self._display_topic_list(topics)
+        self._display_topic_list(self._get_recent_topics())
 
         return content
@@ -7,14 +7,13 @@ configuration files.
 """
 
 import flet as ft
-from pathlib import Path
-import subprocess
 
 from theme import Colors, Typography, Spacing
 from services.tech_stack_analyzer import get_tech_stack_analyzer, TechStackInfo
 from services.project_setup_service import get_project_setup_service, SetupResult
 from services.status_updater import get_status_updater
 from services.app_state import get_wizard_path, clear_wizard_path
+from utils.platform_specific import pick_folder_async
 
 
 class SetupWizardPage:
@@ -377,35 +376,19 @@ class SetupWizardPage:
 
     # Event Handlers
 
-    def _on_pick_directory(self, e):
+    async def _on_pick_directory(self, e):
         """Handle directory picker button click"""
-        # Use macOS native folder picker (AppleScript workaround for Flet bug)
-        try:
-            script = '''
-            tell application "System Events"
-                activate
-                set folderPath to POSIX path of (choose folder with prompt "Select project folder to set up Claude Code")
-            end tell
-            return folderPath
-            '''
-
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+        # Use macOS native folder picker (AppleScript workaround for Flet bug);
+        # awaiting it keeps the window responsive while the dialog is open
+        selected_folder = await pick_folder_async("Select project folder to set up Claude Code")
 
-            if result.returncode == 0 and result.stdout.strip():
-                folder_path = result.stdout.strip()
-                self.selected_path = Path(folder_path)
-                self.path_display.value = str(self.selected_path)
+        if selected_folder:
+            self.selected_path = selected_folder
+            self.path_display.value = str(self.selected_path)
 
-                # Rebuild the UI to enable the Analyze button
-                self.content_container.content = self._build_step_selection()
-                self.page.update()
-        except Exception as ex:
-            print(f"Error picking directory: {ex}")
+            # Rebuild the UI to enable the Analyze button
+            self.content_container.content = self._build_step_selection()
+            self.page.update()
 
     def _on_analyze_click(self, e):
         """Handle analyze button click"""
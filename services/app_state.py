@@ -5,9 +5,10 @@ Follows the singleton service pattern used throughout C3.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
-from health_checks.base import HealthIssue
+from health_checks.base import HealthIssue, Severity
+from utils.issue_filters import SORT_KEYS, group_by_severity, sort_issues
 
 
 @dataclass
@@ -18,12 +19,20 @@ class ScanResult:
     score: int
     issues: List[HealthIssue] = field(default_factory=list)
     detectors_run: int = 0
+    by_severity: Dict[Severity, List[HealthIssue]] = field(init=False, repr=False)
+    sorted_issues: Dict[str, List[HealthIssue]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Bucket and sort issues once, so pages can look them up directly."""
+        self.by_severity = group_by_severity(self.issues)
+        self.sorted_issues = {sort_by: sort_issues(self.issues, sort_by) for sort_by in SORT_KEYS}
 
 
 @dataclass
 class AppState:
     """Global application state."""
     last_scan: Optional[ScanResult] = None
+    scan_version: int = 0  # Bumped whenever last_scan changes
     wizard_path: Optional[Path] = None  # Path for wizard to process
 
 
@@ -44,6 +53,7 @@ def set_last_scan(result: ScanResult):
         result: ScanResult to store
     """
     _state.last_scan = result
+    _state.scan_version += 1
 
 
 def get_last_scan() -> Optional[ScanResult]:
@@ -59,6 +69,19 @@ def get_last_scan() -> Optional[ScanResult]:
 def clear_last_scan():
     """Clear the last scan result."""
     _state.last_scan = None
+    _state.scan_version += 1
+
+
+def get_scan_version() -> int:
+    """
+    Get a counter that changes every time the last scan is replaced or cleared.
+
+    Pages key their derived caches on this instead of object identity.
+
+    Returns:
+        Current scan version
+    """
+    return _state.scan_version
 
 
 def set_wizard_path(path: Path):
@@ -6,14 +6,56 @@ Runs health check detectors against Claude Code projects
 and generates health reports with scores.
 """
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from health_checks.base import BaseDetector, HealthIssue, Severity
+from services.logging_config import get_logger
+from utils.issue_filters import group_by_severity
 
 # Import detector registry
 from health_checks import get_all_detectors
 
+logger = get_logger(__name__)
+
+# Points deducted from the health score per issue of each severity
+_SEVERITY_PENALTY = {
+    Severity.CRITICAL: 20,
+    Severity.WARNING: 10,
+    Severity.INFO: 5,
+}
+
+# Detectors are I/O-bound (file reads, config parsing), so running them on a
+# shared pool overlaps their waits
+_DETECTOR_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="detector")
+atexit.register(_DETECTOR_EXECUTOR.shutdown, wait=False)
+
+
+def _score_color(score: int) -> str:
+    """Color name for a health score (see HealthChecker.get_score_color)."""
+    if score >= 90:
+        return "green"
+    elif score >= 70:
+        return "yellow"
+    elif score >= 50:
+        return "orange"
+    else:
+        return "red"
+
+
+def _score_label(score: int) -> str:
+    """Text label for a health score (see HealthChecker.get_score_label)."""
+    if score >= 90:
+        return "Excellent"
+    elif score >= 70:
+        return "Good"
+    elif score >= 50:
+        return "Fair"
+    else:
+        return "Needs Attention"
+
 
 @dataclass
 class HealthReport:
@@ -25,15 +67,18 @@ class HealthReport:
     detectors_run: int = 0
     has_critical: bool = False
     has_warnings: bool = False
+    score_color: str = field(init=False)  # get_score_color(score), resolved once
+    score_label: str = field(init=False)  # get_score_label(score), resolved once
+    # Issues bucketed by severity in one pass, in CRITICAL/WARNING/INFO order
+    by_severity: Dict[Severity, List[HealthIssue]] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Calculate derived fields."""
-        self.has_critical = any(
-            issue.severity == Severity.CRITICAL for issue in self.issues
-        )
-        self.has_warnings = any(
-            issue.severity == Severity.WARNING for issue in self.issues
-        )
+        self.score_color = _score_color(self.score)
+        self.score_label = _score_label(self.score)
+        self.by_severity = group_by_severity(self.issues)
+        self.has_critical = bool(self.by_severity[Severity.CRITICAL])
+        self.has_warnings = bool(self.by_severity[Severity.WARNING])
 
 
 class HealthChecker:
@@ -43,6 +88,48 @@ class HealthChecker:
         # Get all registered detectors
         self.detectors: List[BaseDetector] = get_all_detectors()
 
+    def iter_check_project(
+        self, project_path: Path, config: Optional[dict] = None
+    ) -> Iterator[Optional[HealthIssue]]:
+        """
+        Run all health checks on a project, yielding each result as it is collected.
+
+        Detectors run concurrently; results are yielded in registration
+        order, so callers can render issues while later checks finish.
+
+        Args:
+            project_path: Root path of the Claude Code project
+            config: Optional parsed configuration
+
+        Yields:
+            One item per detector: its HealthIssue, or None if it passed or failed.
+            Closing the generator early cancels detectors that haven't started.
+        """
+        if config is None:
+            config = {}
+
+        # Start every detector, then collect in registration order so the
+        # report is the same as a sequential run
+        futures = [
+            (detector, _DETECTOR_EXECUTOR.submit(detector.check, project_path, config))
+            for detector in self.detectors
+        ]
+        try:
+            for detector, future in futures:
+                issue = None
+                try:
+                    # No timeout: a slow detector (large_files on a big repo) still
+                    # gets to report, rather than silently counting as a pass
+                    issue = future.result()
+                except Exception:
+                    # Log error but continue with other checks
+                    logger.exception("Error running %s", detector.rule_id)
+                yield issue or None
+        finally:
+            # A caller that stops iterating early doesn't need the rest
+            for _, future in futures:
+                future.cancel()
+
     def check_project(
         self, project_path: Path, config: Optional[dict] = None
     ) -> HealthReport:
@@ -56,35 +143,35 @@ class HealthChecker:
         Returns:
             HealthReport with all detected issues and overall score
         """
-        if config is None:
-            config = {}
+        results = list(self.iter_check_project(project_path, config))
+        return self.build_report(
+            project_path, [issue for issue in results if issue], len(results)
+        )
 
-        issues = []
-        detectors_run = 0
+    def build_report(
+        self, project_path: Path, issues: List[HealthIssue], detectors_run: int
+    ) -> HealthReport:
+        """
+        Score collected issues and wrap them in a HealthReport.
 
-        # Run each detector
-        for detector in self.detectors:
-            detectors_run += 1
-            try:
-                issue = detector.check(project_path, config)
-                if issue:
-                    issues.append(issue)
-            except Exception as e:
-                # Log error but continue with other checks
-                print(f"Error running {detector.rule_id}: {e}")
+        Args:
+            project_path: Root path of the Claude Code project
+            issues: Detected issues in detector order
+            detectors_run: Number of detectors that ran
 
+        Returns:
+            HealthReport with the issues and overall score
+        """
         # Calculate score
         score = self._calculate_score(issues, detectors_run)
 
-        report = HealthReport(
+        return HealthReport(
             project_path=project_path,
             score=score,
             issues=issues,
             detectors_run=detectors_run,
         )
 
-        return report
-
     def _calculate_score(self, issues: List[HealthIssue], total_checks: int) -> int:
         """
         Calculate health score from 0-100.
@@ -103,15 +190,7 @@ class HealthChecker:
         Returns:
             Score from 0-100
         """
-        score = 100
-
-        for issue in issues:
-            if issue.severity == Severity.CRITICAL:
-                score -= 20
-            elif issue.severity == Severity.WARNING:
-                score -= 10
-            elif issue.severity == Severity.INFO:
-                score -= 5
+        score = 100 - sum(_SEVERITY_PENALTY[issue.severity] for issue in issues)
 
         # Ensure score stays in bounds
         return max(0, min(100, score))
@@ -126,14 +205,7 @@ class HealthChecker:
         Returns:
             Color string for UI
         """
-        if score >= 90:
-            return "green"
-        elif score >= 70:
-            return "yellow"
-        elif score >= 50:
-            return "orange"
-        else:
-            return "red"
+        return _score_color(score)
 
     def get_score_label(self, score: int) -> str:
         """
@@ -145,14 +217,7 @@ class HealthChecker:
         Returns:
             Label string
         """
-        if score >= 90:
-            return "Excellent"
-        elif score >= 70:
-            return "Good"
-        elif score >= 50:
-            return "Fair"
-        else:
-            return "Needs Attention"
+        return _score_label(score)
 
 
 # Global singleton instance
@@ -191,14 +256,14 @@ if __name__ == "__main__":
 
     if report.issues:
         print("\n🔍 Issues:")
+        severity_emoji = {
+            Severity.CRITICAL: "🔴",
+            Severity.WARNING: "🟡",
+            Severity.INFO: "🔵",
+        }
         for issue in report.issues:
-            severity_emoji = {
-                Severity.CRITICAL: "🔴",
-                Severity.WARNING: "🟡",
-                Severity.INFO: "🔵",
-            }
             print(
-                f"\n   {severity_emoji.get(issue.severity, '⚪')} [{issue.severity.value.upper()}] {issue.title}"
+                f"\n   {severity_emoji.get(issue.severity, '⚪')} [{issue.severity.label}] {issue.title}"
             )
             print(f"      {issue.message}")
             if issue.file_path:
@@ -10,6 +10,8 @@ Log Strategy:
 - Max size: 10MB per log file
 - Cleanup: On app startup, delete logs older than 7 days
 - Format: [timestamp] [level] [module] message
+- Delivery: callers only enqueue records; a background listener thread
+  does the file and console writes, so logging never blocks the UI loop
 
 Usage:
     from services.logging_config import get_logger
@@ -20,16 +22,19 @@ Usage:
     logger.error("Something broke", exc_info=True)
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 # Global logger instance
 _logger = None
 _log_dir = None
+_listener = None  # QueueListener writing queued records to the real handlers
 
 
 def get_log_directory() -> Path:
@@ -94,7 +99,7 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    global _logger
+    global _logger, _listener
 
     if _logger is not None:
         return _logger
@@ -133,8 +138,14 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # The logger only enqueues; the listener thread does the (possibly
+    # blocking) file and stdout writes
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    # Flush whatever is still queued when the app exits
+    atexit.register(_listener.stop)
 
     # Clean up old logs on startup
     cleanup_old_logs(days_to_keep=7)
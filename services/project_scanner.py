@@ -7,11 +7,44 @@ and extract project information.
 """
 
 import json
+import os
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional, Dict, List
 
 
+class DirectoryListing:
+    """
+    Top-level entries of a directory, read with a single os.scandir call.
+
+    Lets the scanner and the tech stack analyzer answer their many
+    "does X exist here" checks without a stat call each.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            with os.scandir(path) as it:
+                self.entries = {entry.name: entry for entry in it}
+        except OSError:
+            self.entries = {}
+        self._folded = {name.casefold() for name in self.entries}
+
+    def exists(self, name: str) -> bool:
+        """Check whether an entry named name exists."""
+        if name in self.entries:
+            return True
+        # Case-insensitive filesystems (the macOS default) also match other casings
+        return name.casefold() in self._folded and (self.path / name).exists()
+
+    def is_dir(self, name: str) -> bool:
+        """Check whether name is a directory (following symlinks, like Path.is_dir)."""
+        entry = self.entries.get(name)
+        if entry is not None:
+            return entry.is_dir()
+        return name.casefold() in self._folded and (self.path / name).is_dir()
+
+
 @dataclass
 class ProjectInfo:
     """Information about a Claude Code project."""
@@ -32,25 +65,32 @@ class ProjectInfo:
 class ProjectScanner:
     """Scans directories for Claude Code project configuration."""
 
-    def scan_directory(self, directory: Path) -> Optional[ProjectInfo]:
+    def scan_directory(
+        self, directory: Path, listing: Optional[DirectoryListing] = None
+    ) -> Optional[ProjectInfo]:
         """
         Scan a directory for Claude Code configuration.
 
         Args:
             directory: Path to the directory to scan
+            listing: Optional DirectoryListing of directory, shared with other scans
 
         Returns:
             ProjectInfo if this appears to be a Claude Code project, None otherwise
         """
-        if not directory or not directory.exists() or not directory.is_dir():
+        if not directory or not directory.is_dir():
             return None
 
+        if listing is None:
+            listing = DirectoryListing(directory)
+
         claude_dir = directory / ".claude"
-        has_claude_dir = claude_dir.exists() and claude_dir.is_dir()
+        has_claude_dir = listing.is_dir(".claude")
 
         # If no .claude directory, check for root-level CLAUDE.md
         root_claude_md = directory / "CLAUDE.md"
-        if not has_claude_dir and not root_claude_md.exists():
+        has_root_claude_md = listing.exists("CLAUDE.md")
+        if not has_claude_dir and not has_root_claude_md:
             return None
 
         # Found a Claude Code project
@@ -67,7 +107,7 @@ class ProjectScanner:
             if claude_md.exists():
                 project_info.claude_md_path = claude_md
 
-        if project_info.claude_md_path is None and root_claude_md.exists():
+        if project_info.claude_md_path is None and has_root_claude_md:
             project_info.claude_md_path = root_claude_md
 
         # Scan for other config files
@@ -0,0 +1,253 @@
+"""
+Scan Cache Service
+==================
+
+Persists health reports between runs so rescanning an unchanged project
+skips the detectors.
+
+Reports are keyed by project path and stored as JSON with a fingerprint of
+the project tree (relative path, mtime and size of every file, and path and
+mtime of every directory, from stat calls only) and of the detector set and
+app build. status.md counts only by whether it exists, since every scan
+rewrites it. A lookup is a hit only when the fingerprint still matches and
+the entry is younger than the max age, so any edit, addition or deletion -
+or a detector update - forces a fresh scan. Reports read or written during
+this run are also kept in memory, so rescanning the same project skips the
+SQLite read and JSON decode as well.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from health_checks.base import HealthIssue, Severity
+from services.health_checker import HealthReport, get_health_checker
+from services.logging_config import get_logger
+from services.platform_utils import get_app_data_dir
+from services.version import get_version_string
+
+logger = get_logger(__name__)
+
+
+# Directories the detectors never look inside; skipping them keeps the
+# fingerprint walk cheap on projects with large dependency trees
+_SKIP_DIRS = {"node_modules", "venv", ".venv", "venv_312", ".git", "__pycache__",
+              "dist", "build", ".next", ".nuxt", "site-packages"}
+
+# Bump when the stored report JSON layout changes, so older entries miss
+_FORMAT_VERSION = 1
+
+# Entries older than this are rescanned even if nothing changed, as a
+# backstop for inputs the fingerprint can't see
+_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# HealthIssue fields stored as plain strings (file_path is handled separately)
+_ISSUE_TEXT_FIELDS = (
+    "rule_id", "title", "message", "suggestion",
+    "fix_template", "fix_prompt", "topic_slug",
+)
+
+# Project files that count only by existence: the scan itself rewrites
+# status.md after every run, and detectors only check that it is there
+_EXISTENCE_ONLY = {"status.md"}
+
+# Files outside the project that detectors read
+_EXTERNAL_INPUTS = (Path.home() / ".claude" / "settings.json",)
+
+
+def _report_to_json(report: HealthReport) -> str:
+    """Serialize the stored fields of a report; derived fields are rebuilt on load."""
+    issues = []
+    for issue in report.issues:
+        data = {name: getattr(issue, name) for name in _ISSUE_TEXT_FIELDS}
+        data["severity"] = issue.severity.value
+        data["file_path"] = str(issue.file_path) if issue.file_path else None
+        issues.append(data)
+    return json.dumps({
+        "project_path": str(report.project_path),
+        "score": report.score,
+        "detectors_run": report.detectors_run,
+        "issues": issues,
+    })
+
+
+def _report_from_json(text: str) -> HealthReport:
+    """Rebuild a HealthReport from _report_to_json() output."""
+    data = json.loads(text)
+    issues = []
+    for item in data["issues"]:
+        file_path = item.pop("file_path")
+        issues.append(HealthIssue(
+            severity=Severity(item.pop("severity")),
+            file_path=Path(file_path) if file_path else None,
+            **item,
+        ))
+    return HealthReport(
+        project_path=Path(data["project_path"]),
+        score=data["score"],
+        issues=issues,
+        detectors_run=data["detectors_run"],
+    )
+
+
+class ScanCache:
+    """SQLite-backed cache of health reports keyed by project fingerprint."""
+
+    def __init__(self, db_path: Optional[Path] = None, max_age: float = _MAX_AGE_SECONDS):
+        self.db_path = db_path or get_app_data_dir() / "scan_cache.sqlite"
+        self.max_age = max_age
+        self._detector_version = None  # Resolved on first fingerprint
+        self._recent = {}  # Dict[project str, (fingerprint, stored_at, HealthReport)]
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS scan_reports("
+                "project TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, report TEXT NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        """Open a short-lived connection; scans run on worker threads, so none is shared."""
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _get_detector_version(self) -> str:
+        """Identify the detector set and app build, so updated detectors miss old entries."""
+        if self._detector_version is None:
+            rule_ids = ",".join(sorted(d.rule_id for d in get_health_checker().detectors))
+            self._detector_version = f"{get_version_string()}|{rule_ids}"
+        return self._detector_version
+
+    def fingerprint(self, project_path: Path) -> str:
+        """
+        Fingerprint the files a scan depends on.
+
+        Args:
+            project_path: Root path of the project
+
+        Returns:
+            Hex digest that changes whenever a file or directory is added,
+            removed, or modified, or the detectors change
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"v{_FORMAT_VERSION}\n{self._get_detector_version()}\n".encode())
+        stack = [str(project_path)]
+        root_len = len(str(project_path)) + 1
+
+        while stack:
+            current = stack.pop()
+            try:
+                entries = sorted(os.scandir(current), key=lambda entry: entry.name)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in _SKIP_DIRS:
+                            continue
+                        # Directories count too: several detectors only check
+                        # that one exists, even if it is empty
+                        stat = entry.stat(follow_symlinks=False)
+                        digest.update(f"{entry.path[root_len:]}/\0{stat.st_mtime_ns}\n".encode())
+                        stack.append(entry.path)
+                        continue
+                    relative = entry.path[root_len:]
+                    if relative in _EXISTENCE_ONLY:
+                        digest.update(f"{relative}\0exists\n".encode())
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                digest.update(
+                    f"{relative}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode()
+                )
+
+        for path in _EXTERNAL_INPUTS:
+            try:
+                stat = path.stat()
+                digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+            except OSError:
+                digest.update(f"{path}\0missing\n".encode())
+
+        return digest.hexdigest()
+
+    def get(self, project_path: Path, fingerprint: str) -> Optional[HealthReport]:
+        """
+        Look up a stored report.
+
+        Args:
+            project_path: Root path of the project
+            fingerprint: Current fingerprint from fingerprint()
+
+        Returns:
+            Stored HealthReport if the project is unchanged and the entry is
+            younger than max_age, None otherwise
+        """
+        project = str(project_path)
+        recent = self._recent.get(project)
+        if recent is not None and recent[0] == fingerprint:
+            if time.time() - recent[1] > self.max_age:
+                return None
+            return recent[2]
+
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT fingerprint, stored_at, report FROM scan_reports WHERE project = ?",
+                    (project,),
+                ).fetchone()
+            if row is None or row[0] != fingerprint:
+                return None
+            if time.time() - row[1] > self.max_age:
+                return None
+            report = _report_from_json(row[2])
+            self._recent[project] = (fingerprint, row[1], report)
+            return report
+        except Exception as e:
+            # A corrupt or outdated entry just means a fresh scan
+            logger.warning("Scan cache read failed: %s", e)
+            return None
+
+    def put(self, project_path: Path, fingerprint: str, report: HealthReport):
+        """
+        Store a report for a project, replacing any older entry.
+
+        Args:
+            project_path: Root path of the project
+            fingerprint: Fingerprint taken before the report was generated
+            report: HealthReport to store
+        """
+        project = str(project_path)
+        stored_at = time.time()
+        self._recent[project] = (fingerprint, stored_at, report)
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO scan_reports(project, fingerprint, stored_at, report) "
+                    "VALUES (?, ?, ?, ?)",
+                    (project, fingerprint, stored_at, _report_to_json(report)),
+                )
+        except Exception as e:
+            logger.warning("Scan cache write failed: %s", e)
+
+
+# Global singleton instance
+_scan_cache = None
+
+
+def get_scan_cache() -> ScanCache:
+    """Get the global ScanCache instance."""
+    global _scan_cache
+    if _scan_cache is None:
+        _scan_cache = ScanCache()
+    return _scan_cache
@@ -6,9 +6,12 @@ and project characteristics. Used by the Setup Wizard to determine what
 kind of Claude Code configuration to generate.
 """
 
+import os
+from collections import Counter
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
+from services.project_scanner import DirectoryListing
 
 
 @dataclass
@@ -33,30 +36,48 @@ class TechStackAnalyzer:
         "site-packages", ".pytest_cache", "target", "bin", "obj"
     }
 
-    def analyze_directory(self, path: Path) -> TechStackInfo:
+    # Source file extensions for each detectable language
+    LANGUAGE_EXTENSIONS = {
+        "python": (".py",),
+        "javascript": (".js", ".ts", ".jsx", ".tsx"),
+        "go": (".go",),
+        "rust": (".rs",),
+    }
+
+    def analyze_directory(
+        self, path: Path, listing: Optional[DirectoryListing] = None
+    ) -> TechStackInfo:
         """
         Analyze a directory to detect tech stack
 
         Args:
             path: Directory to analyze
+            listing: Optional DirectoryListing of path, shared with other scans
 
         Returns:
             TechStackInfo with detected languages and tools
         """
-        if not path.exists() or not path.is_dir():
+        if not path.is_dir():
             return TechStackInfo()
 
+        # One scandir answers every top-level marker-file check below
+        if listing is None:
+            listing = DirectoryListing(path)
+
         info = TechStackInfo()
 
         # Detect each language
-        info.has_git = self._has_git(path)
-        info.has_env_file = (path / ".env").exists()
+        info.has_git = self._has_git(listing)
+        info.has_env_file = listing.exists(".env")
+
+        # One walk of the tree feeds language detection and file counts
+        ext_counts = self._count_extensions(path)
 
         # Language detection
-        python_detected, python_pm = self._detect_python(path)
-        js_detected, js_pm = self._detect_javascript(path)
-        go_detected = self._detect_go(path)
-        rust_detected = self._detect_rust(path)
+        python_detected, python_pm = self._detect_python(listing, ext_counts)
+        js_detected, js_pm = self._detect_javascript(listing, ext_counts)
+        go_detected = self._detect_go(listing, ext_counts)
+        rust_detected = self._detect_rust(listing, ext_counts)
 
         # Build languages list
         if python_detected:
@@ -78,10 +99,10 @@ class TechStackAnalyzer:
             info.package_managers.append("cargo")
 
         # Count code files
-        info.file_count = self._count_code_files(path, info.languages)
+        info.file_count = self._count_code_files(ext_counts, info.languages)
 
         # Determine primary language (most code files)
-        info.primary_language = self._determine_primary_language(path, info.languages)
+        info.primary_language = self._determine_primary_language(ext_counts, info.languages)
 
         # Calculate confidence
         info.confidence = self._calculate_confidence(info)
@@ -120,11 +141,35 @@ class TechStackAnalyzer:
 
         return False, "Directory doesn't appear to be a code project"
 
-    def _has_git(self, path: Path) -> bool:
+    def _count_extensions(self, path: Path) -> Counter:
+        """
+        Count files by extension in a single walk, skipping EXCLUDE_DIRS
+
+        Returns:
+            Counter mapping lowercase suffix (e.g. ".py") to file count
+        """
+        counts = Counter()
+        stack = [str(path)]
+
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.EXCLUDE_DIRS:
+                                stack.append(entry.path)
+                        else:
+                            counts[os.path.splitext(entry.name)[1].lower()] += 1
+            except OSError:
+                continue
+
+        return counts
+
+    def _has_git(self, listing: DirectoryListing) -> bool:
         """Check if directory is a git repository"""
-        return (path / ".git").exists()
+        return listing.exists(".git")
 
-    def _detect_python(self, path: Path) -> Tuple[bool, List[str]]:
+    def _detect_python(self, listing: DirectoryListing, ext_counts: Counter) -> Tuple[bool, List[str]]:
         """
         Detect Python project
 
@@ -134,27 +179,27 @@ class TechStackAnalyzer:
         package_managers = []
 
         # Check for Python package manager files
-        if (path / "requirements.txt").exists():
+        if listing.exists("requirements.txt"):
             package_managers.append("pip")
 
-        if (path / "pyproject.toml").exists():
+        if listing.exists("pyproject.toml"):
             package_managers.append("poetry/pip")
 
-        if (path / "setup.py").exists() or (path / "setup.cfg").exists():
+        if listing.exists("setup.py") or listing.exists("setup.cfg"):
             package_managers.append("setuptools")
 
-        if (path / "Pipfile").exists():
+        if listing.exists("Pipfile"):
             package_managers.append("pipenv")
 
         # Check for .py files
-        has_py_files = any(path.rglob("*.py"))
+        has_py_files = ext_counts[".py"] > 0
 
         # Python detected if has package manager files OR .py files
         is_python = bool(package_managers) or has_py_files
 
         return is_python, package_managers
 
-    def _detect_javascript(self, path: Path) -> Tuple[bool, List[str]]:
+    def _detect_javascript(self, listing: DirectoryListing, ext_counts: Counter) -> Tuple[bool, List[str]]:
         """
         Detect JavaScript/Node project
 
@@ -164,62 +209,47 @@ class TechStackAnalyzer:
         package_managers = []
 
         # Check for package manager files
-        if (path / "package.json").exists():
+        if listing.exists("package.json"):
             # Determine which package manager
-            if (path / "package-lock.json").exists():
+            if listing.exists("package-lock.json"):
                 package_managers.append("npm")
-            elif (path / "yarn.lock").exists():
+            elif listing.exists("yarn.lock"):
                 package_managers.append("yarn")
-            elif (path / "pnpm-lock.yaml").exists():
+            elif listing.exists("pnpm-lock.yaml"):
                 package_managers.append("pnpm")
             else:
                 package_managers.append("npm")  # Default to npm
 
         # Check for JS/TS files
-        has_js_files = any(path.rglob("*.js")) or any(path.rglob("*.ts"))
-        has_jsx_files = any(path.rglob("*.jsx")) or any(path.rglob("*.tsx"))
+        has_js_files = ext_counts[".js"] > 0 or ext_counts[".ts"] > 0
+        has_jsx_files = ext_counts[".jsx"] > 0 or ext_counts[".tsx"] > 0
 
         # JavaScript detected if has package.json OR .js/.ts files
         is_javascript = bool(package_managers) or has_js_files or has_jsx_files
 
         return is_javascript, package_managers
 
-    def _detect_go(self, path: Path) -> bool:
+    def _detect_go(self, listing: DirectoryListing, ext_counts: Counter) -> bool:
         """Detect Go project"""
-        return (path / "go.mod").exists() or any(path.rglob("*.go"))
+        return listing.exists("go.mod") or ext_counts[".go"] > 0
 
-    def _detect_rust(self, path: Path) -> bool:
+    def _detect_rust(self, listing: DirectoryListing, ext_counts: Counter) -> bool:
         """Detect Rust project"""
-        return (path / "Cargo.toml").exists() or any(path.rglob("*.rs"))
+        return listing.exists("Cargo.toml") or ext_counts[".rs"] > 0
 
-    def _count_code_files(self, path: Path, languages: List[str]) -> int:
+    def _count_code_files(self, ext_counts: Counter, languages: List[str]) -> int:
         """Count code files excluding common build/dependency directories"""
-        extensions = []
-
-        if "python" in languages:
-            extensions.extend(["*.py"])
-        if "javascript" in languages:
-            extensions.extend(["*.js", "*.ts", "*.jsx", "*.tsx"])
-        if "go" in languages:
-            extensions.extend(["*.go"])
-        if "rust" in languages:
-            extensions.extend(["*.rs"])
-
         # If no specific languages, count common extensions
-        if not extensions:
-            extensions = ["*.py", "*.js", "*.ts", "*.jsx", "*.tsx", "*.go", "*.rs"]
-
-        count = 0
-        for ext in extensions:
-            for file_path in path.rglob(ext):
-                # Skip excluded directories
-                if any(excluded in file_path.parts for excluded in self.EXCLUDE_DIRS):
-                    continue
-                count += 1
+        if not languages:
+            languages = list(self.LANGUAGE_EXTENSIONS)
 
-        return count
+        return sum(
+            ext_counts[ext]
+            for lang in languages
+            for ext in self.LANGUAGE_EXTENSIONS[lang]
+        )
 
-    def _determine_primary_language(self, path: Path, languages: List[str]) -> Optional[str]:
+    def _determine_primary_language(self, ext_counts: Counter, languages: List[str]) -> Optional[str]:
         """Determine primary language based on file count"""
         if not languages:
             return None
@@ -227,24 +257,13 @@ class TechStackAnalyzer:
         if len(languages) == 1:
             return languages[0]
 
-        # Count files for each language
+        # Count files for each language (JSX/TSX have never counted toward javascript here)
         counts = {}
         for lang in languages:
-            if lang == "python":
-                counts[lang] = sum(1 for _ in path.rglob("*.py")
-                                  if not any(ex in str(_) for ex in self.EXCLUDE_DIRS))
-            elif lang == "javascript":
-                js_count = sum(1 for _ in path.rglob("*.js")
-                              if not any(ex in str(_) for ex in self.EXCLUDE_DIRS))
-                ts_count = sum(1 for _ in path.rglob("*.ts")
-                              if not any(ex in str(_) for ex in self.EXCLUDE_DIRS))
-                counts[lang] = js_count + ts_count
-            elif lang == "go":
-                counts[lang] = sum(1 for _ in path.rglob("*.go")
-                                  if not any(ex in str(_) for ex in self.EXCLUDE_DIRS))
-            elif lang == "rust":
-                counts[lang] = sum(1 for _ in path.rglob("*.rs")
-                                  if not any(ex in str(_) for ex in self.EXCLUDE_DIRS))
+            if lang == "javascript":
+                counts[lang] = ext_counts[".js"] + ext_counts[".ts"]
+            else:
+                counts[lang] = sum(ext_counts[ext] for ext in self.LANGUAGE_EXTENSIONS[lang])
 
         # Return language with most files
         if counts:
@@ -54,6 +54,19 @@ class TestHealthDetectors:
         assert "Step 1" in issue.fix_prompt
         assert "Step 2" in issue.fix_prompt
 
+    def test_severity_label_is_uppercase_value(self):
+        """Test that Severity.label is the cached uppercase display label."""
+        assert Severity.CRITICAL.label == "CRITICAL"
+        assert Severity.INFO.label is Severity.INFO.label
+
+    def test_equal_issues_hash_alike(self):
+        """Test that HealthIssue is frozen, so equal issues can share dict/set slots."""
+        def make():
+            return HealthIssue("rule", Severity.INFO, "Title", "message", "suggestion")
+
+        assert make() == make()
+        assert len({make(), make()}) == 1
+
 
 class TestHealthCheckerService:
     """Test the health checker service orchestration."""
@@ -83,6 +96,51 @@ class TestHealthCheckerService:
             assert detector.fix_prompt is not None, f"{detector.rule_id} has None fix_prompt"
             assert len(detector.fix_prompt) > 0, f"{detector.rule_id} has empty fix_prompt"
 
+    def test_check_project_keeps_detector_order(self, temp_project_dir, mock_config):
+        """Test that concurrent checks report issues in detector order and survive failures."""
+        from services.health_checker import HealthChecker
+
+        class SlowDetector:
+            rule_id = "slow"
+
+            def check(self, project_path, config):
+                import time
+                time.sleep(0.05)
+                return HealthIssue("slow", Severity.INFO, "Slow", "m", "s")
+
+        class BrokenDetector:
+            rule_id = "broken"
+
+            def check(self, project_path, config):
+                raise RuntimeError("boom")
+
+        checker = HealthChecker()
+        checker.detectors = [SlowDetector(), BrokenDetector(), NoGitignoreDetector()]
+
+        report = checker.check_project(temp_project_dir, mock_config)
+
+        assert report.detectors_run == 3
+        assert [i.rule_id for i in report.issues] == ["slow", "no-gitignore"]
+
+    def test_iter_check_project_yields_one_result_per_detector(self, temp_project_dir, mock_config):
+        """Test that streamed checks yield an issue or None for every detector."""
+        from services.health_checker import HealthChecker
+
+        class PassingDetector:
+            rule_id = "passing"
+
+            def check(self, project_path, config):
+                return None
+
+        checker = HealthChecker()
+        checker.detectors = [NoGitignoreDetector(), PassingDetector()]
+
+        results = list(checker.iter_check_project(temp_project_dir, mock_config))
+
+        assert len(results) == 2
+        assert results[0].rule_id == "no-gitignore"
+        assert results[1] is None
+
 
 # Example of how to run specific tests:
 # pytest tests/test_health_checker.py::TestHealthDetectors::test_no_gitignore_detector_finds_missing_gitignore
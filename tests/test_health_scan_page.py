@@ -0,0 +1,61 @@
+"""
+Tests for scanning through the Health Scan page.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+ft = pytest.importorskip("flet")
+
+import services.scan_cache as scan_cache
+from pages.health_scan import HealthScanPage
+from services.health_checker import HealthChecker
+from services.scan_cache import ScanCache
+
+
+@pytest.fixture
+def scan_page(mock_claude_project, tmp_path, monkeypatch):
+    """A HealthScanPage pointed at the mock project, with its own scan cache."""
+    monkeypatch.setattr(scan_cache, "_scan_cache", ScanCache(db_path=tmp_path / "cache.sqlite"))
+    # status.md already exists, as it does after the first scan of any project
+    (mock_claude_project / "status.md").write_text("# Status\n")
+
+    page = HealthScanPage(SimpleNamespace(theme_mode=ft.ThemeMode.LIGHT, update=lambda: None))
+    page.selected_path = mock_claude_project
+    return page
+
+
+@pytest.fixture
+def detector_runs(monkeypatch):
+    """Count how many times the page runs the detectors."""
+    runs = []
+    run_detectors = HealthChecker.iter_check_project
+
+    def counting(self, project_path, config=None):
+        runs.append(project_path)
+        return run_detectors(self, project_path, config)
+
+    monkeypatch.setattr(HealthChecker, "iter_check_project", counting)
+    return runs
+
+
+class TestHealthScanPage:
+    """Test the scan flow end to end, including the status.md write."""
+
+    def test_rescan_of_unchanged_project_skips_detectors(self, scan_page, detector_runs):
+        """The status.md entry a scan writes doesn't invalidate its own cached report."""
+        asyncio.run(scan_page._on_scan_click(None))
+        asyncio.run(scan_page._on_scan_click(None))
+
+        assert len(detector_runs) == 1
+        assert scan_page.health_report is not None
+
+    def test_rescan_reuses_in_memory_report(self, scan_page, detector_runs):
+        """A rescan in the same run gets the stored report object back, without a database read."""
+        asyncio.run(scan_page._on_scan_click(None))
+        first = scan_page.health_report
+        asyncio.run(scan_page._on_scan_click(None))
+
+        assert scan_page.health_report is first
@@ -0,0 +1,48 @@
+"""
+Tests for the issue filter and sort helpers used by the Fix page.
+"""
+
+from health_checks.base import Severity, HealthIssue
+from utils.issue_filters import group_by_severity, sort_issues
+
+
+def make_issue(rule_id, severity, title):
+    """Build a minimal HealthIssue for filter tests."""
+    return HealthIssue(
+        rule_id=rule_id,
+        severity=severity,
+        title=title,
+        message="message",
+        suggestion="suggestion",
+    )
+
+
+ISSUES = [
+    make_issue("info-b", Severity.INFO, "beta"),
+    make_issue("crit-a", Severity.CRITICAL, "Alpha"),
+    make_issue("warn-c", Severity.WARNING, "charlie"),
+    make_issue("crit-d", Severity.CRITICAL, "delta"),
+]
+
+
+class TestIssueFilters:
+    """Test severity grouping, sorting, and filtering."""
+
+    def test_group_by_severity_keeps_detection_order(self):
+        """Buckets are keyed CRITICAL, WARNING, INFO and keep input order."""
+        buckets = group_by_severity(ISSUES)
+
+        assert list(buckets) == [Severity.CRITICAL, Severity.WARNING, Severity.INFO]
+        assert [i.rule_id for i in buckets[Severity.CRITICAL]] == ["crit-a", "crit-d"]
+
+    def test_sort_by_severity_is_stable(self):
+        """Severity sort puts critical first and keeps ties in input order."""
+        result = sort_issues(ISSUES, "severity")
+
+        assert [i.rule_id for i in result] == ["crit-a", "crit-d", "warn-c", "info-b"]
+
+    def test_sort_by_title_ignores_case(self):
+        """Title sort is case-insensitive."""
+        result = sort_issues(ISSUES, "title")
+
+        assert [i.title for i in result] == ["Alpha", "beta", "charlie", "delta"]
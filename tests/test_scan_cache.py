@@ -0,0 +1,128 @@
+"""
+Tests for the persistent scan cache.
+"""
+
+from health_checks.base import Severity, HealthIssue
+from services.health_checker import HealthReport
+from services.scan_cache import ScanCache
+from services.status_updater import StatusUpdater
+
+
+def make_report(project_path, file_path=None):
+    """Build a one-issue HealthReport for cache tests."""
+    issue = HealthIssue(
+        rule_id="no-readme",
+        severity=Severity.WARNING,
+        title="No README",
+        message="message",
+        suggestion="suggestion",
+        file_path=file_path,
+    )
+    return HealthReport(project_path=project_path, score=90, issues=[issue], detectors_run=1)
+
+
+class TestScanCache:
+    """Test fingerprinting and report round-trips."""
+
+    def test_unchanged_project_hits(self, mock_claude_project, tmp_path):
+        """A stored report comes back while the project is unchanged."""
+        cache = ScanCache(db_path=tmp_path / "cache.sqlite")
+        fingerprint = cache.fingerprint(mock_claude_project)
+        cache.put(mock_claude_project, fingerprint, make_report(mock_claude_project))
+
+        cached = cache.get(mock_claude_project, cache.fingerprint(mock_claude_project))
+
+        assert cached is not None
+        assert cached.score == 90
+        assert cached.issues[0].rule_id == "no-readme"
+
+    def test_new_file_misses(self, mock_claude_project, tmp_path):
+        """Adding a file changes the fingerprint, so the stored report is skipped."""
+        cache = ScanCache(db_path=tmp_path / "cache.sqlite")
+        fingerprint = cache.fingerprint(mock_claude_project)
+        cache.put(mock_claude_project, fingerprint, make_report(mock_claude_project))
+
+        (mock_claude_project / "README.md").write_text("# Project\n")
+
+        assert cache.get(mock_claude_project, cache.fingerprint(mock_claude_project)) is None
+
+    def test_new_empty_dir_changes_fingerprint(self, mock_claude_project, tmp_path):
+        """Creating an empty directory misses, since some detectors only check it exists."""
+        cache = ScanCache(db_path=tmp_path / "cache.sqlite")
+        before = cache.fingerprint(mock_claude_project)
+
+        (mock_claude_project / ".claude" / "agents").mkdir(parents=True)
+
+        assert cache.fingerprint(mock_claude_project) != before
+
+    def test_rescan_after_status_append_hits(self, mock_claude_project, tmp_path):
+        """The status.md entry each scan writes doesn't invalidate the stored report."""
+        cache = ScanCache(db_path=tmp_path / "cache.sqlite")
+        (mock_claude_project / "status.md").write_text("# Status\n")
+        updater = StatusUpdater()
+
+        # Scan, store, then record the scan the way the page does
+        fingerprint = cache.fingerprint(mock_claude_project)
+        cache.put(mock_claude_project, fingerprint, make_report(mock_claude_project))
+        updater.append_scan_result(mock_claude_project, 90, 1)
+
+        # Read through a fresh instance so the stored JSON is decoded
+        reopened = ScanCache(db_path=tmp_path / "cache.sqlite")
+        cached = reopened.get(mock_claude_project, reopened.fingerprint(mock_claude_project))
+
+        assert cached is not None
+        assert cached.score == 90
+
+    def test_creating_status_md_misses(self, mock_claude_project, tmp_path):
+        """status.md appearing changes the no-status-md result, so it forces a rescan."""
+        cache = ScanCache(db_path=tmp_path / "cache.sqlite")
+        before = cache.fingerprint(mock_claude_project)
+
+        StatusUpdater().append_scan_result(mock_claude_project, 90, 1)
+
+        assert cache.fingerprint(mock_claude_project) != before
+
+    def test_skipped_dirs_do_not_affect_fingerprint(self, mock_claude_project, tmp_path):
+        """Changes inside dependency directories don't invalidate the cache."""
+        cache = ScanCache(db_path=tmp_path / "cache.sqlite")
+        before = cache.fingerprint(mock_claude_project)
+
+        node_modules = mock_claude_project / "node_modules"
+        node_modules.mkdir()
+        (node_modules / "index.js").write_text("module.exports = {}\n")
+
+        assert cache.fingerprint(mock_claude_project) == before
+
+    def test_round_trip_keeps_issue_fields(self, mock_claude_project, tmp_path):
+        """Reports come back from JSON with paths, severities and derived fields rebuilt."""
+        cache = ScanCache(db_path=tmp_path / "cache.sqlite")
+        report = make_report(mock_claude_project, file_path=mock_claude_project / "CLAUDE.md")
+        fingerprint = cache.fingerprint(mock_claude_project)
+        cache.put(mock_claude_project, fingerprint, report)
+
+        cached = cache.get(mock_claude_project, fingerprint)
+
+        assert cached.issues[0].severity == Severity.WARNING
+        assert cached.issues[0].file_path == mock_claude_project / "CLAUDE.md"
+        assert cached.has_warnings
+        assert cached.score_label == report.score_label
+
+    def test_expired_entry_misses(self, mock_claude_project, tmp_path):
+        """Entries older than max_age are rescanned even if the project is unchanged."""
+        cache = ScanCache(db_path=tmp_path / "cache.sqlite", max_age=-1)
+        fingerprint = cache.fingerprint(mock_claude_project)
+        cache.put(mock_claude_project, fingerprint, make_report(mock_claude_project))
+
+        assert cache.get(mock_claude_project, fingerprint) is None
+
+    def test_rescan_in_same_run_reuses_report(self, mock_claude_project, tmp_path):
+        """A report stored this run comes back as-is, without re-reading the database."""
+        cache = ScanCache(db_path=tmp_path / "cache.sqlite")
+        fingerprint = cache.fingerprint(mock_claude_project)
+        report = make_report(mock_claude_project)
+        cache.put(mock_claude_project, fingerprint, report)
+
+        assert cache.get(mock_claude_project, fingerprint) is report
+        # A fresh instance (next app launch) still finds it on disk
+        reopened = ScanCache(db_path=tmp_path / "cache.sqlite")
+        assert reopened.get(mock_claude_project, fingerprint).score == report.score
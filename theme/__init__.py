@@ -26,7 +26,9 @@ from .components import (
     divider,
     badge,
     content_type_icon,
+    success_icon,
     result_card,
+    with_opacity,
 )
 
 __all__ = [
@@ -47,5 +49,7 @@ __all__ = [
     "divider",
     "badge",
     "content_type_icon",
+    "success_icon",
     "result_card",
+    "with_opacity",
 ]
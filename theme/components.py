@@ -3,6 +3,8 @@ Claude Code Coach - Styled UI Components
 Reusable component builders with consistent styling
 """
 
+import functools
+
 import flet as ft
 from .constants import Colors, Spacing, Radius, Typography
 
@@ -259,6 +261,17 @@ def content_type_icon(content_class: str, size: int = 22) -> tuple:
     return ft.Icon(icon, color=color, size=size), color
 
 
+@functools.lru_cache(maxsize=128)
+def with_opacity(opacity: float, color: str) -> str:
+    """Memoized ft.Colors.with_opacity for repeated (opacity, color) pairs"""
+    return ft.Colors.with_opacity(opacity, color)
+
+
+def success_icon(size: int = 64) -> ft.Icon:
+    """Green check icon for "no issues" empty states"""
+    return ft.Icon(ft.Icons.CHECK_CIRCLE_ROUNDED, size=size, color=Colors.GREEN_500)
+
+
 def result_card(
     content: ft.Control,
     is_dark: bool = False,
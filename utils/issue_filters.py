@@ -0,0 +1,56 @@
+"""
+Issue Filters
+Pure filter and sort helpers for health issue lists
+"""
+
+from operator import attrgetter
+from typing import Dict, Iterable, List
+from health_checks.base import HealthIssue, Severity
+
+
+# Sort rank for severity ordering: CRITICAL > WARNING > INFO
+SEVERITY_ORDER = {Severity.CRITICAL: 0, Severity.WARNING: 1, Severity.INFO: 2}
+
+# Sort orders offered by the Fix page
+SORT_KEYS = ("severity", "title")
+
+# C-level key for case-insensitive title sorts
+_TITLE_KEY = attrgetter("title_key")
+
+
+def group_by_severity(issues: Iterable[HealthIssue]) -> Dict[Severity, List[HealthIssue]]:
+    """
+    Bucket issues by severity in a single pass.
+
+    Args:
+        issues: Health issues in detection order
+
+    Returns:
+        Dict of Severity -> issues, keyed in SEVERITY_ORDER; each bucket
+        keeps the input order
+    """
+    buckets = {severity: [] for severity in SEVERITY_ORDER}
+    for issue in issues:
+        buckets[issue.severity].append(issue)
+    return buckets
+
+
+def sort_issues(issues: List[HealthIssue], sort_by: str) -> List[HealthIssue]:
+    """
+    Sort issues by severity or title.
+
+    Args:
+        issues: Issues to sort
+        sort_by: "severity" or "title"; anything else keeps input order
+
+    Returns:
+        New sorted list (stable)
+    """
+    if sort_by == "severity":
+        # Concatenating buckets is a stable O(N) severity sort
+        buckets = group_by_severity(issues)
+        return [issue for bucket in buckets.values() for issue in bucket]
+    if sort_by == "title":
+        # Titles are lowercased once when the issue is created
+        return sorted(issues, key=_TITLE_KEY)
+    return list(issues)
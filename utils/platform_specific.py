@@ -15,10 +15,19 @@ When upgrading to Flet 0.8x+ or 1.0 stable:
 Replace with native Flet FilePicker API
 """
 
+import asyncio
 import subprocess
 from pathlib import Path
 from typing import Optional
 
+from services.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+_MAC_VOLUME_PREFIX = "Macintosh HD:"
+_COLON_TO_SLASH = str.maketrans({":": "/"})
+
 
 def mac_path_to_posix(mac_path: str) -> str:
     """
@@ -35,18 +44,133 @@ def mac_path_to_posix(mac_path: str) -> str:
         "/Users/name/file.txt"
     """
     # Remove leading "Macintosh HD:" and convert colons to slashes
-    if mac_path.startswith("Macintosh HD:"):
-        mac_path = mac_path[len("Macintosh HD:"):]
+    if mac_path.startswith(_MAC_VOLUME_PREFIX):
+        mac_path = mac_path[len(_MAC_VOLUME_PREFIX):]
 
-    # Replace colons with slashes
-    posix_path = "/" + mac_path.replace(":", "/")
+    # Replace colons with slashes in one C-level pass
+    posix_path = "/" + mac_path.translate(_COLON_TO_SLASH)
     return posix_path
 
 
-def pick_folder() -> Optional[Path]:
+# Seconds to wait for the user to answer a dialog
+_DIALOG_TIMEOUT = 300  # 5 minutes
+
+_DEFAULT_FOLDER_PROMPT = "Select Claude Code project directory"
+
+
+def _pick_folder_script(prompt: str) -> str:
+    """Build the AppleScript for the folder picker."""
+    return f'''
+        tell application "System Events"
+            activate
+            set theFolder to choose folder with prompt "{prompt}"
+            return POSIX path of theFolder
+        end tell
+        '''
+
+
+def _save_file_script(default_name: str) -> str:
+    """Build the AppleScript for the save dialog."""
+    return f'''
+        try
+            set theFile to choose file name with prompt "Save Health Report" default name "{default_name}"
+            try
+                set posixPath to POSIX path of theFile
+                return "POSIX:" & posixPath
+            on error
+                -- If POSIX conversion fails, return Mac-style path
+                return "MAC:" & (theFile as text)
+            end try
+        on error errMsg number errNum
+            return "ERROR:" & errNum & ":" & errMsg
+        end try
+        '''
+
+
+async def _run_osascript_async(script: str):
+    """
+    Run an AppleScript without blocking the event loop.
+
+    Returns:
+        (returncode, stdout) tuple
+
+    Raises:
+        asyncio.TimeoutError: If the dialog is not answered within _DIALOG_TIMEOUT
+    """
+    proc = await asyncio.create_subprocess_exec(
+        'osascript', '-e', script,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=_DIALOG_TIMEOUT)
+    except BaseException:
+        # Timed out or cancelled - don't leave the dialog process behind
+        if proc.returncode is None:
+            proc.kill()
+            # Reap it so no zombie or dangling transport outlives the dialog;
+            # shielded so a cancellation still waits for the exit
+            await asyncio.shield(proc.wait())
+        raise
+    return proc.returncode, stdout.decode()
+
+
+def _parse_folder_result(returncode: int, stdout: str) -> Optional[Path]:
+    """Turn folder picker output into a Path, or None if cancelled."""
+    if returncode == 0 and stdout.strip():
+        path_str = stdout.strip()
+        return Path(path_str)
+
+    # returncode 128 = user cancelled
+    return None
+
+
+def _parse_save_result(returncode: int, stdout: str) -> Optional[Path]:
+    """Turn save dialog output into a Path, or None if cancelled or failed."""
+    logger.debug("Save dialog result - returncode: %s, stdout: %r", returncode, stdout)
+
+    # Check if output indicates an error
+    if stdout.strip().startswith("ERROR:"):
+        error_parts = stdout.strip().split(":", 3)
+        if len(error_parts) >= 3:
+            error_num = error_parts[1]
+            error_msg = error_parts[2] if len(error_parts) >= 3 else "Unknown error"
+            logger.warning("AppleScript error %s: %s", error_num, error_msg)
+        return None
+
+    if returncode == 0 and stdout.strip():
+        output = stdout.strip()
+
+        # Validate the path
+        if not output or output.startswith("ERROR:"):
+            logger.warning("Invalid file path returned")
+            return None
+
+        # Handle different path formats
+        if output.startswith("POSIX:"):
+            file_path_str = output[6:]  # Remove "POSIX:" prefix
+        elif output.startswith("MAC:"):
+            mac_path = output[4:]  # Remove "MAC:" prefix
+            file_path_str = mac_path_to_posix(mac_path)
+            logger.debug("Converted Mac path to POSIX: %s -> %s", mac_path, file_path_str)
+        else:
+            # Assume it's already a POSIX path
+            file_path_str = output
+
+        return Path(file_path_str)
+
+    # returncode 128 = user cancelled
+    logger.info("Save dialog cancelled or failed - returncode: %s", returncode)
+    return None
+
+
+def pick_folder(prompt: str = _DEFAULT_FOLDER_PROMPT) -> Optional[Path]:
     """
     Open native macOS folder picker dialog.
 
+    Args:
+        prompt: Prompt shown in the dialog
+
     Returns:
         Path object if folder selected, None if cancelled or error
 
@@ -54,33 +178,41 @@ def pick_folder() -> Optional[Path]:
         subprocess.TimeoutExpired: If dialog times out (5 minutes)
     """
     try:
-        script = '''
-        tell application "System Events"
-            activate
-            set theFolder to choose folder with prompt "Select Claude Code project directory"
-            return POSIX path of theFolder
-        end tell
-        '''
-
         result = subprocess.run(
-            ['osascript', '-e', script],
+            ['osascript', '-e', _pick_folder_script(prompt)],
             capture_output=True,
             text=True,
-            timeout=300  # 5 minute timeout
+            timeout=_DIALOG_TIMEOUT
         )
+        return _parse_folder_result(result.returncode, result.stdout)
 
-        if result.returncode == 0 and result.stdout.strip():
-            path_str = result.stdout.strip()
-            return Path(path_str)
-
-        # returncode 128 = user cancelled
+    except subprocess.TimeoutExpired:
+        logger.warning("Folder picker timed out")
+        return None
+    except Exception:
+        logger.exception("Failed to open folder picker")
         return None
 
-    except subprocess.TimeoutExpired:
-        print("Folder picker timed out")
+
+async def pick_folder_async(prompt: str = _DEFAULT_FOLDER_PROMPT) -> Optional[Path]:
+    """
+    Open native macOS folder picker dialog without blocking the event loop.
+
+    Args:
+        prompt: Prompt shown in the dialog
+
+    Returns:
+        Path object if folder selected, None if cancelled, timed out, or error
+    """
+    try:
+        returncode, stdout = await _run_osascript_async(_pick_folder_script(prompt))
+        return _parse_folder_result(returncode, stdout)
+
+    except asyncio.TimeoutError:
+        logger.warning("Folder picker timed out")
         return None
-    except Exception as ex:
-        print(f"Failed to open folder picker: {str(ex)}")
+    except Exception:
+        logger.exception("Failed to open folder picker")
         return None
 
 
@@ -101,72 +233,43 @@ def save_file_dialog(default_name: str) -> Optional[Path]:
         Handles both POSIX and Mac-style path formats from AppleScript.
     """
     try:
-        script = f'''
-        try
-            set theFile to choose file name with prompt "Save Health Report" default name "{default_name}"
-            try
-                set posixPath to POSIX path of theFile
-                return "POSIX:" & posixPath
-            on error
-                -- If POSIX conversion fails, return Mac-style path
-                return "MAC:" & (theFile as text)
-            end try
-        on error errMsg number errNum
-            return "ERROR:" & errNum & ":" & errMsg
-        end try
-        '''
-
-        print(f"Opening file save dialog with default name: {default_name}")
+        logger.debug("Opening file save dialog with default name: %s", default_name)
 
         result = subprocess.run(
-            ['osascript', '-e', script],
+            ['osascript', '-e', _save_file_script(default_name)],
             capture_output=True,
             text=True,
-            timeout=300  # 5 minute timeout
+            timeout=_DIALOG_TIMEOUT
         )
+        return _parse_save_result(result.returncode, result.stdout)
 
-        print(f"Dialog result - returncode: {result.returncode}")
-        print(f"Dialog result - stdout: '{result.stdout}'")
+    except subprocess.TimeoutExpired:
+        logger.warning("File save dialog timed out")
+        return None
+    except Exception:
+        logger.exception("Failed to open save dialog")
+        return None
 
-        # Check if output indicates an error
-        if result.stdout.strip().startswith("ERROR:"):
-            error_parts = result.stdout.strip().split(":", 3)
-            if len(error_parts) >= 3:
-                error_num = error_parts[1]
-                error_msg = error_parts[2] if len(error_parts) >= 3 else "Unknown error"
-                print(f"AppleScript error {error_num}: {error_msg}")
-            return None
 
-        if result.returncode == 0 and result.stdout.strip():
-            output = result.stdout.strip()
-
-            # Validate the path
-            if not output or output.startswith("ERROR:"):
-                print("Invalid file path returned")
-                return None
-
-            # Handle different path formats
-            if output.startswith("POSIX:"):
-                file_path_str = output[6:]  # Remove "POSIX:" prefix
-            elif output.startswith("MAC:"):
-                mac_path = output[4:]  # Remove "MAC:" prefix
-                file_path_str = mac_path_to_posix(mac_path)
-                print(f"Converted Mac path to POSIX: {mac_path} -> {file_path_str}")
-            else:
-                # Assume it's already a POSIX path
-                file_path_str = output
-
-            return Path(file_path_str)
-
-        # returncode 128 = user cancelled
-        print(f"Dialog cancelled or failed - returncode: {result.returncode}")
-        return None
+async def save_file_dialog_async(default_name: str) -> Optional[Path]:
+    """
+    Open native macOS file save dialog without blocking the event loop.
 
-    except subprocess.TimeoutExpired:
-        print("File save dialog timed out")
+    Args:
+        default_name: Default filename (e.g., "report_20261009.txt")
+
+    Returns:
+        Path object if file location chosen, None if cancelled, timed out, or error
+    """
+    try:
+        logger.debug("Opening file save dialog with default name: %s", default_name)
+
+        returncode, stdout = await _run_osascript_async(_save_file_script(default_name))
+        return _parse_save_result(returncode, stdout)
+
+    except asyncio.TimeoutError:
+        logger.warning("File save dialog timed out")
         return None
-    except Exception as ex:
-        print(f"Failed to open save dialog: {str(ex)}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Failed to open save dialog")
         return None
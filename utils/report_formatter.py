@@ -4,7 +4,28 @@ Formats health scan results as plain text for export
 """
 
 from health_checks.base import Severity
-from services.health_checker import get_health_checker
+
+
+# Severity -> (section name, emoji)
+_SEVERITY_META = {
+    Severity.CRITICAL: ("CRITICAL", "🔴"),
+    Severity.WARNING: ("WARNING", "🟡"),
+    Severity.INFO: ("INFO", "🔵"),
+}
+
+
+def _format_issue(issue) -> str:
+    """Format one issue as a single text block (fixed fields in one f-string)."""
+    text = (
+        f"\n[{issue.rule_id}] {issue.title}\n"
+        f"Message: {issue.message}\n"
+        f"Suggestion: {issue.suggestion}\n"
+    )
+    if issue.file_path:
+        text += f"File: {issue.file_path}\n"
+    if issue.topic_slug:
+        text += f"Learn more: {issue.topic_slug}\n"
+    return text + "\n"
 
 
 def format_health_report(health_report) -> str:
@@ -31,47 +52,24 @@ def format_health_report(health_report) -> str:
     if not health_report:
         return ""
 
-    checker = get_health_checker()
-    score_label = checker.get_score_label(health_report.score)
-
-    lines = []
-    lines.append("=" * 70)
-    lines.append("CLAUDE CODE HEALTH REPORT")
-    lines.append("=" * 70)
-    lines.append(f"\nProject: {health_report.project_path}")
-    lines.append(f"Health Score: {health_report.score}/100 ({score_label})")
-    lines.append(f"Detectors Run: {health_report.detectors_run}")
-    lines.append(f"Issues Found: {len(health_report.issues)}")
-    lines.append("")
+    bar = "=" * 70
+    parts = [
+        f"{bar}\nCLAUDE CODE HEALTH REPORT\n{bar}\n"
+        f"\nProject: {health_report.project_path}\n"
+        f"Health Score: {health_report.score}/100 ({health_report.score_label})\n"
+        f"Detectors Run: {health_report.detectors_run}\n"
+        f"Issues Found: {len(health_report.issues)}\n\n"
+    ]
 
     if not health_report.issues:
-        lines.append("✅ No issues found! Your Claude Code project looks healthy.")
+        parts.append("✅ No issues found! Your Claude Code project looks healthy.\n")
     else:
-        # Group issues by severity
-        critical_issues = [i for i in health_report.issues if i.severity == Severity.CRITICAL]
-        warning_issues = [i for i in health_report.issues if i.severity == Severity.WARNING]
-        info_issues = [i for i in health_report.issues if i.severity == Severity.INFO]
-
-        for issues, severity_name, emoji in [
-            (critical_issues, "CRITICAL", "🔴"),
-            (warning_issues, "WARNING", "🟡"),
-            (info_issues, "INFO", "🔵"),
-        ]:
+        # Issues are grouped by severity once, when the report is built
+        for severity, issues in health_report.by_severity.items():
             if issues:
-                lines.append(f"\n{emoji} {severity_name} ISSUES ({len(issues)})")
-                lines.append("-" * 70)
-                for issue in issues:
-                    lines.append(f"\n[{issue.rule_id}] {issue.title}")
-                    lines.append(f"Message: {issue.message}")
-                    lines.append(f"Suggestion: {issue.suggestion}")
-                    if issue.file_path:
-                        lines.append(f"File: {issue.file_path}")
-                    if issue.topic_slug:
-                        lines.append(f"Learn more: {issue.topic_slug}")
-                    lines.append("")
-
-    lines.append("=" * 70)
-    lines.append(f"Generated by Claude Code Coach (C3)")
-    lines.append("=" * 70)
+                severity_name, emoji = _SEVERITY_META[severity]
+                parts.append(f"\n{emoji} {severity_name} ISSUES ({len(issues)})\n{'-' * 70}\n")
+                parts.extend(map(_format_issue, issues))
 
-    return "\n".join(lines)
+    parts.append(f"{bar}\nGenerated by Claude Code Coach (C3)\n{bar}")
+    return "".join(parts)